@@ -15,6 +15,7 @@ import functools
 import logging
 import secrets
 import signal
+import threading
 import time
 from datetime import datetime, timedelta
 from typing import Any, Callable, Dict, List, Optional, Type
@@ -277,6 +278,11 @@ def with_timeout(timeout_seconds: float) -> Callable:
                     error_code="OPERATION_TIMEOUT",
                 )
 
+            # SIGALRM handlers can only be installed from the main thread; worker
+            # threads (e.g. concurrent exports) run without the alarm.
+            if threading.current_thread() is not threading.main_thread():
+                return func(*args, **kwargs)
+
             # Set up timeout
             old_handler = signal.signal(signal.SIGALRM, timeout_handler)
             signal.alarm(int(timeout_seconds))
@@ -1,15 +1,379 @@
+import csv
+import itertools
 import json
+import numbers
+import os
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time, timedelta
+from operator import itemgetter, methodcaller
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, Iterable, List, Sequence, Tuple, Union
 
 import pandas as pd
 import yaml
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell.cell import ERROR_CODES, ILLEGAL_CHARACTERS_RE
+from openpyxl.compat import safe_string
+from openpyxl.utils import get_column_letter
+from openpyxl.utils.datetime import to_excel
+from openpyxl.utils.exceptions import IllegalCharacterError
 
 from .error_recovery import RetryConfig, monitor_errors, robust_operation, with_timeout
 from .exceptions import ExportError, FileOperationError, InvalidFormatError
 
+# Prefer the libyaml-backed emitter/loader when PyYAML was built with it
+try:
+    from yaml import CDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import Dumper as _YamlDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+# orjson is an optional speedup; stdlib json remains the reference behaviour
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# pyarrow backs the optional Parquet/Feather formats
+try:
+    import pyarrow  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependency
+    pyarrow = None
+
+
+# Rows per pandas chunk when loading CSV files
+_CSV_CHUNK_ROWS = 100_000
+
+# Object columns with fewer distinct values than this share of rows are
+# stored as categoricals in columnar exports
+_CATEGORICAL_RATIO = 0.5
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize data to indented UTF-8 JSON bytes."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_SERIALIZE_NUMPY,
+            )
+        except orjson.JSONEncodeError:
+            # Let stdlib json handle (or reject) what orjson refuses
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _json_loads(payload: bytes) -> Any:
+    """Deserialize JSON bytes."""
+    if orjson is not None:
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            # stdlib json also accepts NaN/Infinity literals
+            pass
+    return json.loads(payload)
+
+
+def _write_bytes(path: Path, payload: bytes) -> None:
+    """Write a complete payload to path through a raw, unbuffered descriptor."""
+    # O_BINARY only exists on Windows, where omitting it translates newlines
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            # os.write may be partial for large payloads; keep going until done
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def _read_csv_columns(file_path: Path) -> Dict[str, Dict[int, Any]]:
+    """Read a CSV file into ``{column: {row_index: value}}`` chunk by chunk.
+
+    Equivalent to ``pd.read_csv(path).to_dict()`` without holding a DataFrame
+    for the whole file; dtypes are inferred per chunk rather than globally.
+    """
+    columns: Dict[str, Dict[int, Any]] = {}
+    with pd.read_csv(file_path, chunksize=_CSV_CHUNK_ROWS) as reader:
+        for chunk in reader:
+            for column, values in chunk.to_dict(orient="dict").items():
+                columns.setdefault(column, {}).update(values)
+    return columns
+
+
+def _read_xlsx_columns(file_path: Path) -> Dict[str, Dict[int, Any]]:
+    """Read the first worksheet into ``{column: {row_index: value}}``.
+
+    Rows are streamed from a read-only workbook. Header naming, empty cells
+    (NaN), trailing blank rows and int-to-float promotion in numeric columns
+    with gaps follow ``pd.read_excel(path).to_dict()``.
+    """
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, ())
+        names: List[str] = []
+        for i, name in enumerate(header):
+            name = f"Unnamed: {i}" if name is None else name
+            candidate, dup = name, 0
+            while candidate in names:
+                dup += 1
+                candidate = f"{name}.{dup}"
+            names.append(candidate)
+
+        values: List[List[Any]] = [[] for _ in names]
+        kept = 0
+        for row in rows:
+            row = row[: len(names)]
+            for column, value in zip(values, row):
+                column.append(value)
+            for column in values[len(row) :]:
+                column.append(None)
+            if any(value is not None for value in row):
+                kept = len(values[0]) if values else 0
+    finally:
+        workbook.close()
+
+    table: Dict[str, Dict[int, Any]] = {}
+    for name, column in zip(names, values):
+        column = column[:kept]
+        present = [value for value in column if value is not None]
+        numeric = all(
+            isinstance(value, (int, float)) and not isinstance(value, bool)
+            for value in present
+        )
+        if numeric and len(present) < len(column):
+            column = [float("nan") if v is None else float(v) for v in column]
+        elif numeric and any(isinstance(value, float) for value in present):
+            column = [float(value) for value in column]
+        else:
+            column = [float("nan") if v is None else v for v in column]
+        table[name] = dict(enumerate(column))
+    return table
+
+
+def _require_pyarrow(file_format: str) -> None:
+    """Raise ExportError if the optional pyarrow dependency is unavailable."""
+    if pyarrow is None:
+        raise ExportError(
+            f"{file_format} support requires pyarrow: "
+            "pip install 'rabbitmirror[performance]'",
+            export_format=file_format,
+            error_code="MISSING_DEPENDENCY",
+        )
+
+
+def _has_nested_values(records: Iterable[Dict[str, Any]]) -> bool:
+    """Check whether any record holds a dict value, in one pass over all values."""
+    values = itertools.chain.from_iterable(map(methodcaller("values"), records))
+    # Collecting the distinct value types is cheaper than isinstance per value
+    return any(issubclass(value_type, dict) for value_type in set(map(type, values)))
+
+
+def _cell_value(value: Any) -> Any:
+    """Map missing values to empty cells, matching pandas' CSV/Excel writers."""
+    if value is None or (isinstance(value, float) and value != value):
+        return None
+    return value
+
+
+def _excel_value(value: Any) -> Any:
+    """Map a value to an Excel cell, stringifying non-scalars like pandas does."""
+    value = _cell_value(value)
+    if value is None or pd.api.types.is_scalar(value):
+        return value
+    return str(value)
+
+
+# Sheets with more rows than this skip openpyxl and are serialized directly
+_XLSX_DIRECT_WRITE_ROWS = 10_000
+
+_XLSX_ROWS_PER_WRITE = 1_000
+
+_SPREADSHEET_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_RELATIONSHIP_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_DOCUMENT_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+# Static parts of a single-sheet workbook
+_XLSX_PARTS = {
+    "[Content_Types].xml": (
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" '
+        'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '<Override PartName="/xl/styles.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        "</Types>"
+    ),
+    "_rels/.rels": (
+        f'<Relationships xmlns="{_RELATIONSHIP_NS}">'
+        f'<Relationship Id="rId1" Type="{_DOCUMENT_REL_NS}/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        "</Relationships>"
+    ),
+    "xl/workbook.xml": (
+        f'<workbook xmlns="{_SPREADSHEET_NS}" xmlns:r="{_DOCUMENT_REL_NS}">'
+        '<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets>'
+        "</workbook>"
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        f'<Relationships xmlns="{_RELATIONSHIP_NS}">'
+        f'<Relationship Id="rId1" Type="{_DOCUMENT_REL_NS}/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        f'<Relationship Id="rId2" Type="{_DOCUMENT_REL_NS}/styles" '
+        'Target="styles.xml"/>'
+        "</Relationships>"
+    ),
+    # Style 1-4 carry the number formats openpyxl assigns to temporal values
+    "xl/styles.xml": (
+        f'<styleSheet xmlns="{_SPREADSHEET_NS}">'
+        '<numFmts count="4">'
+        '<numFmt numFmtId="164" formatCode="yyyy-mm-dd h:mm:ss"/>'
+        '<numFmt numFmtId="165" formatCode="yyyy-mm-dd"/>'
+        '<numFmt numFmtId="166" formatCode="h:mm:ss"/>'
+        '<numFmt numFmtId="167" formatCode="[hh]:mm:ss"/>'
+        "</numFmts>"
+        '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+        '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+        '<fill><patternFill patternType="gray125"/></fill></fills>'
+        '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/>'
+        "</border></borders>"
+        '<cellStyleXfs count="1">'
+        '<xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        '<cellXfs count="5">'
+        '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+        + "".join(
+            f'<xf numFmtId="{fmt_id}" fontId="0" fillId="0" borderId="0" xfId="0"'
+            ' applyNumberFormat="1"/>'
+            for fmt_id in (164, 165, 166, 167)
+        )
+        + "</cellXfs>"
+        '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/>'
+        "</cellStyles>"
+        "</styleSheet>"
+    ),
+}
+
+# Checked in order, so datetime precedes its date base class
+_XLSX_TEMPORAL_STYLES = (
+    (datetime, 1),
+    (date, 2),
+    (time, 3),
+    (timedelta, 4),
+)
+
+_XML_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", "\r": "&#13;"})
+
+
+def _xlsx_cell(ref: str, value: Any) -> str:
+    """Serialize one cell the way openpyxl's write-only worksheet would."""
+    if isinstance(value, str):
+        value = value[:32767]
+        if ILLEGAL_CHARACTERS_RE.search(value):
+            raise IllegalCharacterError(f"{value} cannot be used in worksheets.")
+        if not value:
+            return ""
+        if len(value) > 1 and value.startswith("="):
+            return f'<c r="{ref}"><f>{value[1:].translate(_XML_ESCAPES)}</f><v></v></c>'
+        if value in ERROR_CODES:
+            return f'<c r="{ref}" t="e"><v>{value}</v></c>'
+        space = ' xml:space="preserve"' if value != value.strip() else ""
+        text = value.translate(_XML_ESCAPES)
+        return f'<c r="{ref}" t="inlineStr"><is><t{space}>{text}</t></is></c>'
+    if isinstance(value, bool):
+        return f'<c r="{ref}" t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, numbers.Number) and not isinstance(value, complex):
+        return f'<c r="{ref}" t="n"><v>{safe_string(value)}</v></c>'
+    for temporal_type, style in _XLSX_TEMPORAL_STYLES:
+        if isinstance(value, temporal_type):
+            if getattr(value, "tzinfo", None) is not None:
+                raise TypeError(
+                    "Excel does not support timezones in datetimes. "
+                    "The tzinfo in the datetime/time object must be set to None."
+                )
+            serial = safe_string(to_excel(value))
+            return f'<c r="{ref}" s="{style}" t="n"><v>{serial}</v></c>'
+    if not pd.api.types.is_scalar(value):
+        # Lists, dicts and other containers are written as text, like pandas
+        return _xlsx_cell(ref, str(value))
+    raise ValueError(f"Cannot convert {value!r} to Excel")
+
+
+def _write_xlsx(
+    path: Path,
+    columns: List[str],
+    rows: Iterable[Sequence[Any]],
+    row_count: int,
+) -> None:
+    """Write a single-sheet workbook by emitting the SpreadsheetML directly.
+
+    Produces the same cell values as the openpyxl write-only path without
+    allocating a Python cell object per value.
+    """
+    letters = [get_column_letter(i) for i in range(1, len(columns) + 1)]
+    dimension = f"A1:{letters[-1]}{row_count + 1}" if letters else "A1"
+
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, xml in _XLSX_PARTS.items():
+            archive.writestr(name, _XML_DECLARATION + xml)
+
+        with archive.open("xl/worksheets/sheet1.xml", "w") as sheet:
+            sheet.write(
+                (
+                    f'{_XML_DECLARATION}<worksheet xmlns="{_SPREADSHEET_NS}">'
+                    f'<dimension ref="{dimension}"/><sheetData>'
+                ).encode("utf-8")
+            )
+            if columns:
+                rows = itertools.chain([columns], rows)
+            pending: List[str] = []
+            for row_idx, row in enumerate(rows, start=1):
+                cells = "".join(
+                    _xlsx_cell(f"{letter}{row_idx}", value)
+                    for letter, value in zip(letters, row)
+                    if _cell_value(value) is not None
+                )
+                pending.append(f'<row r="{row_idx}">{cells}</row>')
+                if len(pending) >= _XLSX_ROWS_PER_WRITE:
+                    sheet.write("".join(pending).encode("utf-8"))
+                    pending.clear()
+            pending.append("</sheetData></worksheet>")
+            sheet.write("".join(pending).encode("utf-8"))
+
 
 class ExportFormatter:
+    # Export format -> exporter method
+    _EXPORTERS = {
+        "json": "_export_json",
+        "yaml": "_export_yaml",
+        "csv": "_export_csv",
+        "excel": "_export_excel",
+        "parquet": "_export_parquet",
+        "feather": "_export_feather",
+    }
+
+    # File suffix -> loader method
+    _LOADERS = {
+        ".json": "_load_json",
+        ".yaml": "_load_yaml",
+        ".yml": "_load_yaml",
+        ".csv": "_load_csv",
+        ".xlsx": "_load_excel",
+        ".xls": "_load_excel",
+        ".parquet": "_load_columnar",
+        ".feather": "_load_columnar",
+    }
+
     def __init__(self, output_dir: str = "exports"):
         self.output_dir = Path(output_dir)
         self.retry_config = RetryConfig(
@@ -56,52 +420,17 @@ class ExportFormatter:
 
         # Determine the file format from extension
         file_format = file_path.suffix.lower()
+        loader = self._LOADERS.get(file_format)
+        if loader is None:
+            raise InvalidFormatError(
+                f"Unsupported file format: {file_format}. "
+                f"Supported formats: {', '.join(self._LOADERS)}",
+                file_path=str(file_path),
+                error_code="UNSUPPORTED_FORMAT",
+            )
 
         try:
-            if file_format == ".json":
-                with open(file_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
-
-            elif file_format in [".yaml", ".yml"]:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    return yaml.safe_load(f)
-
-            elif file_format == ".csv":
-                try:
-                    df = pd.read_csv(file_path)
-                    return df.to_dict(orient="dict")
-                except pd.errors.EmptyDataError as exc:
-                    raise InvalidFormatError(
-                        f"CSV file is empty: {file_path}",
-                        file_path=str(file_path),
-                        error_code="EMPTY_CSV_FILE",
-                    ) from exc
-                except pd.errors.ParserError as e:
-                    raise InvalidFormatError(
-                        f"CSV parsing error: {str(e)}",
-                        file_path=str(file_path),
-                        error_code="CSV_PARSE_ERROR",
-                    ) from e
-
-            elif file_format in [".xlsx", ".xls"]:
-                try:
-                    df = pd.read_excel(file_path)
-                    return df.to_dict(orient="dict")
-                except Exception as e:
-                    raise InvalidFormatError(
-                        f"Excel file reading error: {str(e)}",
-                        file_path=str(file_path),
-                        error_code="EXCEL_READ_ERROR",
-                    ) from e
-
-            else:
-                raise InvalidFormatError(
-                    f"Unsupported file format: {file_format}. "
-                    "Supported formats: .json, .yaml, .yml, .csv, .xlsx, .xls",
-                    file_path=str(file_path),
-                    error_code="UNSUPPORTED_FORMAT",
-                )
-
+            return getattr(self, loader)(file_path)
         except (FileNotFoundError, PermissionError, OSError) as e:
             raise FileOperationError(
                 f"Error reading file {file_path}: {str(e)}",
@@ -128,7 +457,8 @@ class ExportFormatter:
 
         Args:
             data: Data to export
-            export_format: Format to export to (json, yaml, csv, excel)
+            export_format: Format to export to (json, yaml, csv, excel,
+                parquet, feather)
             filename: Base filename (without extension)
 
         Returns:
@@ -137,23 +467,17 @@ class ExportFormatter:
         Raises:
             ExportError: If export operation fails
         """
-        exporters = {
-            "json": self._export_json,
-            "yaml": self._export_yaml,
-            "csv": self._export_csv,
-            "excel": self._export_excel,
-        }
-
-        if export_format not in exporters:
+        exporter = self._EXPORTERS.get(export_format)
+        if exporter is None:
             raise ExportError(
                 f"Unsupported export format: {export_format}. "
-                f"Supported formats: {', '.join(exporters.keys())}",
+                f"Supported formats: {', '.join(self._EXPORTERS)}",
                 export_format=export_format,
                 error_code="UNSUPPORTED_EXPORT_FORMAT",
             )
 
         try:
-            return exporters[export_format](data, filename)
+            return getattr(self, exporter)(data, filename)
         except Exception as e:
             raise ExportError(
                 f"Export failed for format {export_format}: {str(e)}",
@@ -161,13 +485,97 @@ class ExportFormatter:
                 error_code="EXPORT_FAILED",
             ) from e
 
+    def export_many(
+        self, data: Dict[str, Any], formats: Iterable[str], filename: str
+    ) -> Dict[str, str]:
+        """Export data to several formats concurrently.
+
+        Args:
+            data: Data to export; it is only read, never modified
+            formats: Formats to export to (see export_data)
+            filename: Base filename (without extension) shared by all formats
+
+        Returns:
+            Dict mapping each format to the path of its exported file
+
+        Raises:
+            ExportError: If any of the exports fails
+        """
+        formats = list(dict.fromkeys(formats))
+        if not formats:
+            return {}
+
+        # Each format writes its own file, so exports overlap their disk I/O
+        with ThreadPoolExecutor(max_workers=len(formats)) as executor:
+            futures = {
+                export_format: executor.submit(
+                    self.export_data, data, export_format, filename
+                )
+                for export_format in formats
+            }
+            return {
+                export_format: future.result()
+                for export_format, future in futures.items()
+            }
+
+    def _load_json(self, file_path: Path) -> Any:
+        """Load a JSON file."""
+        with open(file_path, "rb") as f:
+            return _json_loads(f.read())
+
+    def _load_yaml(self, file_path: Path) -> Any:
+        """Load a YAML file."""
+        with open(file_path, "r", encoding="utf-8") as f:
+            return yaml.load(f, Loader=_YamlLoader)  # nosec B506
+
+    def _load_csv(self, file_path: Path) -> Dict[str, Dict[int, Any]]:
+        """Load a CSV file as ``{column: {row_index: value}}``."""
+        try:
+            return _read_csv_columns(file_path)
+        except pd.errors.EmptyDataError as exc:
+            raise InvalidFormatError(
+                f"CSV file is empty: {file_path}",
+                file_path=str(file_path),
+                error_code="EMPTY_CSV_FILE",
+            ) from exc
+        except pd.errors.ParserError as e:
+            raise InvalidFormatError(
+                f"CSV parsing error: {str(e)}",
+                file_path=str(file_path),
+                error_code="CSV_PARSE_ERROR",
+            ) from e
+
+    def _load_excel(self, file_path: Path) -> Dict[str, Dict[int, Any]]:
+        """Load the first sheet of an Excel workbook."""
+        try:
+            if file_path.suffix.lower() == ".xlsx":
+                return _read_xlsx_columns(file_path)
+            # Legacy .xls workbooks are not readable by openpyxl
+            df = pd.read_excel(file_path)
+            return df.to_dict(orient="dict")
+        except Exception as e:
+            raise InvalidFormatError(
+                f"Excel file reading error: {str(e)}",
+                file_path=str(file_path),
+                error_code="EXCEL_READ_ERROR",
+            ) from e
+
+    def _load_columnar(self, file_path: Path) -> Dict[str, Dict[int, Any]]:
+        """Load a Parquet or Feather file."""
+        file_format = file_path.suffix.lower()
+        _require_pyarrow(file_format.lstrip("."))
+        if file_format == ".parquet":
+            df = pd.read_parquet(file_path)
+        else:
+            df = pd.read_feather(file_path)
+        return df.to_dict(orient="dict")
+
     @with_timeout(30.0)
     def _export_json(self, data: Dict[str, Any], filename: str) -> str:
         """Export data as JSON."""
         output_path = self.output_dir / f"{filename}.json"
         try:
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            _write_bytes(output_path, _json_dumps(data))
             return str(output_path)
         except (OSError, PermissionError) as e:
             raise FileOperationError(
@@ -188,8 +596,14 @@ class ExportFormatter:
         """Export data as YAML."""
         output_path = self.output_dir / f"{filename}.yaml"
         try:
-            with open(output_path, "w", encoding="utf-8") as f:
-                yaml.dump(data, f, allow_unicode=True, sort_keys=False)
+            payload = yaml.dump(
+                data,
+                Dumper=_YamlDumper,
+                allow_unicode=True,
+                sort_keys=False,
+                encoding="utf-8",
+            )
+            _write_bytes(output_path, payload)
             return str(output_path)
         except (OSError, PermissionError) as e:
             raise FileOperationError(
@@ -210,26 +624,15 @@ class ExportFormatter:
         """Export data as CSV."""
         output_path = self.output_dir / f"{filename}.csv"
 
-        # Convert the data to a format suitable for CSV
-        if (
-            isinstance(data, dict)
-            and "entries" in data
-            and isinstance(data["entries"], list)
-        ):
-            # If data has an 'entries' list, use that directly
-            df = pd.DataFrame(data["entries"])
-        elif isinstance(data, dict) and all(isinstance(v, list) for v in data.values()):
-            # If data is a dict of lists, convert to DataFrame directly
-            df = pd.DataFrame(data)
-        elif isinstance(data, list):
-            # If data is a list of dicts, convert to DataFrame
-            df = pd.DataFrame(data)
-        else:
-            # For other structures, flatten the data first
-            flat_data = self._flatten_dict(data)
-            df = pd.DataFrame([flat_data])
-
-        df.to_csv(output_path, index=False, encoding="utf-8")
+        # Write rows straight from the normalized table; building a DataFrame
+        # only to format it back into text is the bulk of the cost otherwise.
+        columns, rows, _ = self._to_table(data)
+        with open(
+            output_path, "w", encoding="utf-8", newline="", buffering=1 << 20
+        ) as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(columns)
+            writer.writerows([_cell_value(value) for value in row] for row in rows)
         return str(output_path)
 
     @with_timeout(30.0)
@@ -237,37 +640,127 @@ class ExportFormatter:
         """Export data as Excel file."""
         output_path = self.output_dir / f"{filename}.xlsx"
 
-        # Convert the data to a format suitable for Excel (same logic as CSV)
+        # Stream rows through a write-only workbook so openpyxl never builds
+        # the full cell graph in memory.
+        columns, rows, row_count = self._to_table(data)
+        if row_count > _XLSX_DIRECT_WRITE_ROWS:
+            # The direct writer also records the sheet's <dimension>, so
+            # read-only readers can size large sheets without a scan
+            _write_xlsx(output_path, columns, rows, row_count)
+            return str(output_path)
+
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet(title="Sheet1")
+        if columns:
+            worksheet.append(columns)
+        for row in rows:
+            worksheet.append([_excel_value(value) for value in row])
+        workbook.save(str(output_path))
+        return str(output_path)
+
+    @with_timeout(30.0)
+    def _export_parquet(self, data: Dict[str, Any], filename: str) -> str:
+        """Export data as zstd-compressed Parquet."""
+        _require_pyarrow("parquet")
+        output_path = self.output_dir / f"{filename}.parquet"
+        self._to_dataframe(data).to_parquet(
+            output_path, engine="pyarrow", compression="zstd", index=False
+        )
+        return str(output_path)
+
+    @with_timeout(30.0)
+    def _export_feather(self, data: Dict[str, Any], filename: str) -> str:
+        """Export data as Feather (Arrow IPC)."""
+        _require_pyarrow("feather")
+        output_path = self.output_dir / f"{filename}.feather"
+        self._to_dataframe(data).to_feather(output_path)
+        return str(output_path)
+
+    def _to_dataframe(self, data: Any) -> pd.DataFrame:
+        """Build a DataFrame from the normalized export table."""
+        columns, rows, _ = self._to_table(data)
+        df = pd.DataFrame(list(rows), columns=columns)
+
+        # Repeated strings (channel, category, ...) become dictionary-encoded
+        # categoricals, which Arrow stores once per distinct value.
+        for column in df.select_dtypes(include=["object", "string"]):
+            try:
+                distinct = df[column].nunique()
+            except TypeError:
+                continue  # Unhashable values such as nested lists
+            if distinct < _CATEGORICAL_RATIO * len(df):
+                df[column] = df[column].astype("category")
+        return df
+
+    def _to_table(self, data: Any) -> Tuple[List[str], Iterable[Sequence[Any]], int]:
+        """Normalize export data into a header, row values and the row count.
+
+        Accepts the same shapes as the tabular exporters: a dict with an
+        ``entries`` list, a dict of equal-length lists, a list of dicts, or an
+        arbitrary (possibly nested) dict that is flattened into a single row.
+        Records containing nested dicts are flattened the same way.
+        """
         if (
             isinstance(data, dict)
             and "entries" in data
             and isinstance(data["entries"], list)
         ):
-            # If data has an 'entries' list, use that directly
-            df = pd.DataFrame(data["entries"])
+            records = data["entries"]
         elif isinstance(data, dict) and all(isinstance(v, list) for v in data.values()):
-            # If data is a dict of lists, convert to DataFrame directly
-            df = pd.DataFrame(data)
+            if len({len(v) for v in data.values()}) > 1:
+                raise ValueError("All arrays must be of the same length")
+            row_count = len(next(iter(data.values()), []))
+            return list(data), zip(*data.values()), row_count
         elif isinstance(data, list):
-            # If data is a list of dicts, convert to DataFrame
-            df = pd.DataFrame(data)
+            records = data
         else:
-            # For other structures, flatten the data first
-            flat_data = self._flatten_dict(data)
-            df = pd.DataFrame([flat_data])
+            records = [self._flatten_dict(data)]
 
-        df.to_excel(output_path, index=False, engine="openpyxl")
-        return str(output_path)
+        # Lists or scalars get positional columns 0, 1, ... like a DataFrame
+        # built from the same records
+        if not all(isinstance(record, dict) for record in records):
+            df = pd.DataFrame(records)
+            return list(df.columns), df.itertuples(index=False, name=None), len(df)
+
+        # Nested records are flattened like a standalone dict; history entries
+        # are normally flat, in which case the records are used untouched.
+        if _has_nested_values(records):
+            records = [
+                (
+                    self._flatten_dict(record)
+                    if any(isinstance(value, dict) for value in record.values())
+                    else record
+                )
+                for record in records
+            ]
+
+        # Homogeneous records (the usual history export) share one schema, so
+        # rows are pulled with a single itemgetter instead of per-key lookups
+        schema = tuple(records[0]) if records else ()
+        if len(schema) > 1 and all(tuple(record) == schema for record in records):
+            return list(schema), map(itemgetter(*schema), records), len(records)
+
+        # Column order follows first appearance across records, like pandas
+        columns = list(dict.fromkeys(key for record in records for key in record))
+        rows = ([record.get(c) for c in columns] for record in records)
+        return columns, rows, len(records)
 
     def _flatten_dict(
         self, d: Dict[str, Any], parent_key: str = "", sep: str = "_"
     ) -> Dict[str, Any]:
         """Flatten a nested dictionary."""
-        items: List[tuple] = []
-        for k, v in d.items():
-            new_key = f"{parent_key}{sep}{k}" if parent_key else k
-            if isinstance(v, dict):
-                items.extend(self._flatten_dict(v, new_key, sep).items())
+        # Walk with an explicit stack of item iterators instead of recursing so
+        # deep payloads cost no extra frames and keys keep their original order.
+        flat: Dict[str, Any] = {}
+        stack = [(parent_key, iter(d.items()))]
+        while stack:
+            prefix, items = stack[-1]
+            for k, v in items:
+                new_key = f"{prefix}{sep}{k}" if prefix else k
+                if isinstance(v, dict):
+                    stack.append((new_key, iter(v.items())))
+                    break
+                flat[new_key] = v
             else:
-                items.append((new_key, v))
-        return dict(items)
+                stack.pop()
+        return flat
@@ -1,15 +1,64 @@
 import logging
+import os
 import re
+import threading
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from bs4 import BeautifulSoup
+from lxml import etree
 
 from .error_recovery import RetryConfig, monitor_errors, with_retry
 from .exceptions import InvalidFormatError, ParsingError
 
+# Characters decoded per read while streaming the history file
+_READ_CHUNK_SIZE = 1 << 16
+
+# Parsed files kept in memory by HistoryParser.parse(); older ones are evicted
+_PARSE_CACHE_FILES = 2
+
+# Compiled once; class matching mirrors CSS ``div.content-cell`` semantics
+_CONTENT_CELL_XPATH = etree.XPath(
+    ".//div[contains(concat(' ', normalize-space(@class), ' '), ' content-cell ')]"
+)
+_CAPTION_XPATH = etree.XPath(
+    ".//div[contains(concat(' ', normalize-space(@class), ' '),"
+    " ' mdl-typography--caption ')]"
+)
+
+
+def _element_text(element: etree._Element) -> str:
+    """Join an element's stripped text fragments (BeautifulSoup strip=True)."""
+    return "".join(
+        fragment.strip() for fragment in element.itertext() if fragment.strip()
+    )
+
+
+def _is_content_cell(element: etree._Element) -> bool:
+    """Check whether an element carries the ``content-cell`` class."""
+    return "content-cell" in (element.get("class") or "").split()
+
+
+def _release(element: etree._Element) -> None:
+    """Drop a processed element and everything parsed before it."""
+    element.clear(keep_tail=True)
+    for node in (element, *element.iterancestors()):
+        parent = node.getparent()
+        if parent is None:
+            break
+        while node.getprevious() is not None:
+            del parent[0]
+
 
 class HistoryParser:
+    # Parsed entries of the most recently used files, keyed by path and
+    # stamped with (mtime_ns, size); shared across instances
+    _parse_cache: "OrderedDict[str, Tuple[int, int, List[Dict[str, Any]]]]" = (
+        OrderedDict()
+    )
+    _parse_cache_lock = threading.Lock()
+
     def __init__(self, file_path: str):
         self.file_path = file_path
         self.retry_config = RetryConfig(
@@ -21,37 +70,85 @@ class HistoryParser:
     @with_retry(RetryConfig(max_attempts=3, base_delay=0.5))
     @monitor_errors
     def parse(self) -> List[Dict[str, Any]]:
-        """Parse the YouTube watch history file and return structured data."""
+        """Parse the YouTube watch history file and return structured data.
+
+        Results for the last few files are cached and reused until the file's
+        mtime or size changes.
+        """
         try:
-            return self._parse_with_fallback()
-        except FileNotFoundError as e:
-            raise ParsingError(
+            path = str(self.file_path)
+            st = os.stat(path)
+            stamp = (st.st_mtime_ns, st.st_size)
+            with self._parse_cache_lock:
+                cached = self._parse_cache.get(path)
+                if cached is not None and cached[:2] == stamp:
+                    self._parse_cache.move_to_end(path)
+            if cached is not None and cached[:2] == stamp:
+                entries = cached[2]
+            else:
+                entries = self._parse_with_fallback()
+                with self._parse_cache_lock:
+                    self._parse_cache[path] = (*stamp, entries)
+                    self._parse_cache.move_to_end(path)
+                    while len(self._parse_cache) > _PARSE_CACHE_FILES:
+                        self._parse_cache.popitem(last=False)
+        except Exception as e:
+            raise self._to_parsing_error(e) from e
+        # Hand out copies so callers can mutate results without touching the cache
+        return [dict(entry) for entry in entries]
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached parse results."""
+        with cls._parse_cache_lock:
+            cls._parse_cache.clear()
+
+    def iter_entries(self) -> Iterator[Dict[str, Any]]:
+        """Yield parsed entries while streaming through the history file.
+
+        Unlike parse(), the document tree is never held in memory as a whole:
+        each top-level content cell is discarded once its entries are yielded.
+        """
+        try:
+            yield from self._extract_entries(self._iter_content_cells())
+        except Exception as e:
+            raise self._to_parsing_error(e) from e
+
+    def _to_parsing_error(self, error: Exception) -> ParsingError:
+        """Map an error raised while parsing to the matching ParsingError."""
+        if isinstance(error, FileNotFoundError):
+            return ParsingError(
                 f"File not found: {self.file_path}",
                 file_path=self.file_path,
                 error_code="FILE_NOT_FOUND",
-            ) from e
-        except UnicodeDecodeError as e:
-            raise ParsingError(
-                f"File encoding error: {str(e)}",
+            )
+        if isinstance(error, UnicodeDecodeError):
+            return ParsingError(
+                f"File encoding error: {str(error)}",
                 file_path=self.file_path,
                 error_code="ENCODING_ERROR",
-            ) from e
-        except Exception as e:
-            raise ParsingError(
-                f"Error parsing file: {str(e)}",
-                file_path=self.file_path,
-                error_code="PARSE_ERROR",
-            ) from e
+            )
+        return ParsingError(
+            f"Error parsing file: {str(error)}",
+            file_path=self.file_path,
+            error_code="PARSE_ERROR",
+        )
 
     def _parse_with_fallback(self) -> List[Dict[str, Any]]:
         """Parse file with multiple encoding fallbacks."""
+        return list(self._extract_entries(self._iter_content_cells()))
+
+    def _detect_encoding(self) -> str:
+        """Return the first supported encoding that decodes the whole file."""
         encodings = ["utf-8", "utf-8-sig", "latin-1", "cp1252"]
 
         for encoding in encodings:
             try:
+                # Decode chunk by chunk so validation needs constant memory
                 with open(self.file_path, "r", encoding=encoding) as f:
-                    soup = BeautifulSoup(f, "lxml")
-                return self._extract_entries(soup)
+                    while f.read(_READ_CHUNK_SIZE):
+                        pass
+                return encoding
             except UnicodeDecodeError:
                 continue
 
@@ -62,16 +159,49 @@ class HistoryParser:
             error_code="ENCODING_FAILED",
         )
 
-    def _extract_entries(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
-        """Extract individual entries from the parsed HTML."""
-        entries = []
+    def _iter_content_cells(self) -> Iterator[etree._Element]:
+        """Stream-parse the file and yield content cells in document order."""
+        encoding = self._detect_encoding()
+        parser = etree.HTMLPullParser(events=("end",), tag="div")
+
+        with open(self.file_path, "r", encoding=encoding) as f:
+            for chunk in iter(lambda: f.read(_READ_CHUNK_SIZE), ""):
+                parser.feed(chunk)
+                yield from self._drain_content_cells(parser)
+
+        try:
+            parser.close()
+        except etree.XMLSyntaxError:
+            # Raised for documents without any elements (e.g. empty files)
+            return
+        yield from self._drain_content_cells(parser)
+
+    @staticmethod
+    def _drain_content_cells(parser: etree.HTMLPullParser) -> Iterator[etree._Element]:
+        """Yield completed top-level content cells and release them afterwards."""
+        for _, element in parser.read_events():
+            if not _is_content_cell(element):
+                continue
+            if any(_is_content_cell(a) for a in element.iterancestors("div")):
+                # Nested cells are emitted with their outermost cell
+                continue
+            yield element
+            yield from _CONTENT_CELL_XPATH(element)
+            _release(element)
+
+    def _extract_entries(
+        self, cells: Iterable[etree._Element]
+    ) -> Iterator[Dict[str, Any]]:
+        """Extract individual entries from parsed content cells."""
+        parsed = 0
         failed_entries = 0
 
-        for i, entry in enumerate(soup.select("div.content-cell")):
+        for i, entry in enumerate(cells):
             try:
                 parsed_entry = self._parse_entry(entry)
                 if parsed_entry:
-                    entries.append(parsed_entry)
+                    parsed += 1
+                    yield parsed_entry
             except (AttributeError, ValueError, TypeError) as e:
                 failed_entries += 1
                 # Log but don't fail the entire operation
@@ -80,29 +210,27 @@ class HistoryParser:
         if failed_entries > 0:
             logging.info(
                 "Successfully parsed %s entries, failed: %s",
-                len(entries),
+                parsed,
                 failed_entries,
             )
 
-        return entries
-
     def _parse_entry(self, entry) -> Optional[Dict[str, Any]]:
         """Parse a single watch history entry with error recovery."""
         try:
-            title_tag = entry.find("a")
-            if not title_tag:
+            title_tag = entry.find(".//a")
+            if title_tag is None:
                 return None
 
-            title = title_tag.get_text(strip=True)
+            title = _element_text(title_tag)
             if not title:
                 return None
 
             url = title_tag.get("href", "").strip()
 
             # Extract timestamp with fallback
-            timestamp_tag = entry.find("div", class_="mdl-typography--caption")
+            timestamp_tags = _CAPTION_XPATH(entry)
             timestamp_raw = (
-                timestamp_tag.get_text(strip=True) if timestamp_tag else "Unknown"
+                _element_text(timestamp_tags[0]) if timestamp_tags else "Unknown"
             )
 
             try:
@@ -126,27 +254,74 @@ class HistoryParser:
         if timestamp_str == "Unknown" or not timestamp_str.strip():
             return datetime.now().isoformat()
 
-        # Try multiple timestamp formats
-        formats = [
-            "%b %d, %Y, %I:%M:%S %p",  # Dec 15, 2023, 2:30:45 PM
-            "%b %d, %Y %I:%M:%S %p",  # Dec 15, 2023 2:30:45 PM
-            "%Y-%m-%d %H:%M:%S",  # 2023-12-15 14:30:45
-            "%Y-%m-%dT%H:%M:%S",  # 2023-12-15T14:30:45
-            "%Y-%m-%d",  # 2023-12-15
-        ]
+        converted = _parse_timestamp(timestamp_str)
+        if converted is None:
+            raise InvalidFormatError(
+                f"Invalid timestamp format: {timestamp_str}",
+                file_path=self.file_path,
+                error_code="INVALID_TIMESTAMP_FORMAT",
+            )
+        return converted
 
-        timestamp_clean = re.sub(r"\s+[A-Z]{3}$", "", timestamp_str)
 
-        for fmt in formats:
+# Timestamp formats tried in order by _parse_timestamp
+_TIMESTAMP_FORMATS = [
+    "%b %d, %Y, %I:%M:%S %p",  # Dec 15, 2023, 2:30:45 PM
+    "%b %d, %Y %I:%M:%S %p",  # Dec 15, 2023 2:30:45 PM
+    "%Y-%m-%d %H:%M:%S",  # 2023-12-15 14:30:45
+    "%Y-%m-%dT%H:%M:%S",  # 2023-12-15T14:30:45
+    "%Y-%m-%d",  # 2023-12-15
+]
+
+_TIMEZONE_SUFFIX_RE = re.compile(r"\s+[A-Z]{3}$")
+
+# Fast path for the two YouTube layouts at the top of _TIMESTAMP_FORMATS
+_YOUTUBE_TIMESTAMP_RE = re.compile(
+    r"([A-Za-z]{3}) (\d{1,2}), (\d{4}),? (\d{1,2}):(\d{2}):(\d{2}) ([AaPp][Mm])"
+)
+
+_MONTHS = {
+    "Jan": 1,
+    "Feb": 2,
+    "Mar": 3,
+    "Apr": 4,
+    "May": 5,
+    "Jun": 6,
+    "Jul": 7,
+    "Aug": 8,
+    "Sep": 9,
+    "Oct": 10,
+    "Nov": 11,
+    "Dec": 12,
+}
+
+
+@lru_cache(maxsize=65536)
+def _parse_timestamp(timestamp_str: str) -> Optional[str]:
+    """Parse a raw timestamp string to ISO format, or None if no format matches.
+
+    Watch history exports repeat the same timestamp strings heavily, so results
+    are cached to avoid re-running strptime on every duplicate.
+    """
+    timestamp_clean = _TIMEZONE_SUFFIX_RE.sub("", timestamp_str)
+
+    match = _YOUTUBE_TIMESTAMP_RE.fullmatch(timestamp_clean)
+    if match:
+        month_name, day, year, hour, minute, second, meridiem = match.groups()
+        month = _MONTHS.get(month_name.title())
+        hour_12 = int(hour)
+        if month and 1 <= hour_12 <= 12:
+            hour_24 = hour_12 % 12 + (12 if meridiem.upper() == "PM" else 0)
             try:
-                dt = datetime.strptime(timestamp_clean, fmt)
-                return dt.isoformat()
+                return datetime(
+                    int(year), month, int(day), hour_24, int(minute), int(second)
+                ).isoformat()
             except ValueError:
-                continue
+                pass  # Out-of-range field; let strptime decide
 
-        # If all formats fail, raise error
-        raise InvalidFormatError(
-            f"Invalid timestamp format: {timestamp_str}",
-            file_path=self.file_path,
-            error_code="INVALID_TIMESTAMP_FORMAT",
-        )
+    for fmt in _TIMESTAMP_FORMATS:
+        try:
+            return datetime.strptime(timestamp_clean, fmt).isoformat()
+        except ValueError:
+            continue
+    return None
@@ -1,47 +1,120 @@
 import re
-from collections import defaultdict
+import warnings
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
 
 import numpy as np
-from sklearn.preprocessing import MinMaxScaler
+
+# Title pattern matchers used by ProfileSimulator._extract_title_patterns
+_EPISODE_RE = re.compile(r"EP\.?\s*\d+", re.I)
+_PARENTHESES_RE = re.compile(r"\(.*\)")
+_BRACKETS_RE = re.compile(r"\[.*\]")
+
+
+class _AliasSampler:
+    """Vose alias table for O(1) draws from a fixed categorical distribution."""
+
+    def __init__(self, keys: Iterable[Hashable], weights: Iterable[float]):
+        self.keys = list(keys)
+        scaled = np.asarray(list(weights), dtype=float)
+        scaled = scaled * len(scaled) / scaled.sum()
+
+        self.prob = np.ones(len(scaled))
+        self.alias = np.arange(len(scaled))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.prob[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] += scaled[less] - 1.0
+            (small if scaled[more] < 1.0 else large).append(more)
+
+    @classmethod
+    def from_items(cls, items: Iterable[Hashable]) -> "_AliasSampler":
+        """Build a sampler weighting each distinct item by its frequency."""
+        counts = Counter(items)
+        return cls(counts.keys(), counts.values())
+
+    def draw(self, rng: np.random.Generator) -> Any:
+        """Draw a single key."""
+        i = rng.integers(len(self.keys))
+        return self.keys[i if rng.random() < self.prob[i] else self.alias[i]]
+
+    def draw_many(self, rng: np.random.Generator, n: int) -> List[Any]:
+        """Draw n keys with two vectorized uniform draws."""
+        columns = rng.integers(len(self.keys), size=n)
+        picks = np.where(
+            rng.random(n) < self.prob[columns],
+            columns,
+            self.alias[columns],
+        )
+        return [self.keys[i] for i in picks]
 
 
 class ProfileSimulator:
     def __init__(self, seed: int = None):
-        self.rng = np.random.RandomState(seed)
-        self.scaler = MinMaxScaler()
+        self.rng = np.random.default_rng(seed)
         self.time_bins = 24  # 24 hours
         self.interval_bins = 50  # For interval distribution
+        # (profile fingerprint, patterns) of the most recently analyzed profile
+        self._patterns_cache: Optional[Tuple[Tuple, Dict[str, Any]]] = None
 
     def simulate_profile(
         self, base_profile: List[Dict[str, Any]], duration_days: int = 30
     ) -> List[Dict[str, Any]]:
         """Simulate a watch history profile based on existing patterns."""
         # Extract patterns from base profile
-        viewing_patterns = self._extract_viewing_patterns(base_profile)
+        viewing_patterns = self._cached_viewing_patterns(base_profile)
 
         # Generate simulated timeline
         timeline = self._generate_timeline(duration_days)
 
+        # Draw every day's count and all per-entry samples up front so the
+        # RNG is called a handful of times per simulation, not per entry
+        daily_counts = self._sample_daily_counts(
+            viewing_patterns["daily_counts"], len(timeline)
+        )
+        samples = self._draw_entry_samples(viewing_patterns, int(daily_counts.sum()))
+
         # Generate simulated entries
         simulated_entries = []
-        current_time = timeline[0]
+        offset = 0
 
-        for _ in timeline:
-            # Generate number of videos to watch based on average daily count
-            daily_count = self._sample_daily_count(viewing_patterns["daily_counts"])
+        for day, daily_count in zip(timeline, daily_counts):
+            day_samples = {
+                name: values[offset : offset + daily_count]
+                for name, values in samples.items()
+            }
+            offset += daily_count
 
             # Generate entries for the day
             daily_entries = self._generate_daily_entries(
-                current_time, viewing_patterns, daily_count
+                day, viewing_patterns, int(daily_count), day_samples
             )
 
             simulated_entries.extend(daily_entries)
-            current_time += timedelta(days=1)
 
         return simulated_entries
 
+    def _cached_viewing_patterns(self, profile: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Return viewing patterns, reusing them when the profile is unchanged.
+
+        The fingerprint holds the fields the analyses read, so an edited
+        profile is re-analyzed even if it is the same list object.
+        """
+        fingerprint = tuple(
+            (entry["timestamp"], entry.get("title"), entry.get("category"))
+            for entry in profile
+        )
+        if self._patterns_cache is not None and self._patterns_cache[0] == fingerprint:
+            return self._patterns_cache[1]
+
+        patterns = self._extract_viewing_patterns(profile)
+        self._patterns_cache = (fingerprint, patterns)
+        return patterns
+
     def _extract_viewing_patterns(
         self, profile: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
@@ -49,11 +122,14 @@ class ProfileSimulator:
         # Sort profile by timestamp
         sorted_profile = sorted(profile, key=lambda x: x["timestamp"])
 
+        # Parse timestamps once and share them across the time-based analyses
+        times = self._parse_timestamps(sorted_profile)
+
         # Extract all pattern types
-        time_dist = self._analyze_time_distribution(sorted_profile)
+        time_dist = self._analyze_time_distribution(sorted_profile, times)
         content_dist = self._analyze_content_distribution(sorted_profile)
-        interval_dist = self._analyze_interval_distribution(sorted_profile)
-        daily_counts = self._analyze_daily_counts(sorted_profile)
+        interval_dist = self._analyze_interval_distribution(sorted_profile, times)
+        daily_counts = self._analyze_daily_counts(sorted_profile, times)
         title_patterns = self._analyze_title_patterns(sorted_profile)
 
         return {
@@ -62,6 +138,13 @@ class ProfileSimulator:
             "interval_dist": interval_dist,
             "daily_counts": daily_counts,
             "title_patterns": title_patterns,
+            # Pattern lists hold one item per matching title; the samplers
+            # collapse them so each title draw is O(1) instead of O(len).
+            "title_samplers": {
+                content_type: _AliasSampler.from_items(patterns)
+                for content_type, patterns in title_patterns.items()
+                if patterns
+            },
         }
 
     def _generate_timeline(self, duration_days: int) -> List[datetime]:
@@ -72,50 +155,113 @@ class ProfileSimulator:
         return [start_date + timedelta(days=x) for x in range(duration_days)]
 
     def _generate_daily_entries(
-        self, start_time: datetime, patterns: Dict[str, Any], count: int
+        self,
+        start_time: datetime,
+        patterns: Dict[str, Any],
+        count: int,
+        samples: Optional[Dict[str, np.ndarray]] = None,
     ) -> List[Dict[str, Any]]:
-        """Generate watch history entries for a single day."""
-        entries = []
-        current_time = start_time
-
-        for _ in range(count):
-            # Sample time of day based on distribution
-            hour = self._sample_from_distribution(patterns["time_dist"])
-            current_time = current_time.replace(hour=hour)
+        """Generate watch history entries for a single day.
 
-            # Sample content type and generate title
-            content_type = self._sample_from_dict(patterns["content_dist"])
-            title = self._generate_title(patterns["title_patterns"], content_type)
+        ``samples`` holds pre-drawn per-entry values (see _draw_entry_samples);
+        they are drawn here when not supplied.
+        """
+        if samples is None:
+            samples = self._draw_entry_samples(patterns, count)
 
-            # Add random minutes within the hour
-            minutes = self.rng.randint(0, 60)
-            current_time = current_time.replace(minute=minutes)
+        categories = samples["categories"]
+        title_samplers = patterns.get("title_samplers", {})
+        offsets = self._entry_offsets(
+            samples["hours"], samples["minutes"], samples.get("intervals")
+        )
 
+        entries = []
+        for content_type, offset in zip(categories[:count], offsets[:count].tolist()):
+            title = self._generate_title(
+                patterns["title_patterns"],
+                content_type,
+                title_samplers.get(content_type),
+            )
             entries.append(
                 {
                     "title": title,
-                    "timestamp": current_time.isoformat(),
+                    "timestamp": (start_time + timedelta(minutes=offset)).isoformat(),
                     "category": content_type,
                     "simulated": True,
                 }
             )
 
-            # Add interval to next video
-            if patterns["interval_dist"].size > 0:
-                interval = self._sample_from_distribution(patterns["interval_dist"])
-                current_time += timedelta(minutes=int(interval))
-
         return entries
 
-    def _analyze_time_distribution(self, profile: List[Dict[str, Any]]) -> np.ndarray:
+    @staticmethod
+    def _entry_offsets(
+        hours: np.ndarray, minutes: np.ndarray, intervals: Optional[np.ndarray]
+    ) -> np.ndarray:
+        """Compute each entry's offset in minutes from the start of its day.
+
+        Every entry is placed at its sampled hour and minute on the day the
+        previous entry's interval ended on, so the only sequential state is the
+        day carry, which a cumulative sum resolves for all entries at once.
+        """
+        minute_of_day = np.asarray(hours, dtype=np.int64) * 60 + minutes
+        day = np.zeros_like(minute_of_day)
+        if intervals is not None and len(minute_of_day) > 1:
+            carry = (minute_of_day[:-1] + intervals[:-1]) // (24 * 60)
+            day[1:] = np.cumsum(carry)
+        return day * 24 * 60 + minute_of_day
+
+    def _draw_entry_samples(
+        self, patterns: Dict[str, Any], count: int
+    ) -> Dict[str, np.ndarray]:
+        """Draw hours, content types, minutes and intervals for count entries."""
+        samples = {
+            "hours": self._sample_from_distribution_batch(patterns["time_dist"], count),
+            "categories": self._sample_from_dict_batch(patterns["content_dist"], count),
+            "minutes": self.rng.integers(0, 60, size=count),
+        }
+        if patterns["interval_dist"].size > 0:
+            samples["intervals"] = self._sample_from_distribution_batch(
+                patterns["interval_dist"], count
+            )
+        return samples
+
+    @staticmethod
+    def _parse_timestamps(profile: List[Dict[str, Any]]) -> np.ndarray:
+        """Parse every entry's ISO timestamp into a ``datetime64[us]`` array.
+
+        NumPy parses plain ISO strings in one vectorized call. Strings it does
+        not take as-is (UTC offsets, compact dates) go through
+        ``datetime.fromisoformat`` and keep their local wall-clock time.
+        """
+        stamps = [entry["timestamp"] for entry in profile]
+        if all(stamp[4:5] == "-" for stamp in stamps):
+            try:
+                with warnings.catch_warnings():
+                    # NumPy only warns when it drops a UTC offset
+                    warnings.simplefilter("error")
+                    return np.array(stamps, dtype="datetime64[us]")
+            except (ValueError, UserWarning, DeprecationWarning):
+                pass
+        return np.array(
+            [
+                datetime.fromisoformat(stamp).replace(tzinfo=None).isoformat()
+                for stamp in stamps
+            ],
+            dtype="datetime64[us]",
+        )
+
+    def _analyze_time_distribution(
+        self,
+        profile: List[Dict[str, Any]],
+        times: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
         """Analyze the distribution of view times throughout the day."""
-        hours = []
-        for entry in profile:
-            dt = datetime.fromisoformat(entry["timestamp"])
-            hours.append(dt.hour)
+        if times is None:
+            times = self._parse_timestamps(profile)
+        hours = (times - times.astype("datetime64[D]")) // np.timedelta64(1, "h")
 
-        # Create histogram of hours
-        hist, _ = np.histogram(hours, bins=self.time_bins, range=(0, 24))
+        # Histogram of hours; each hour falls into bin hour * bins // 24
+        hist = np.bincount(hours * self.time_bins // 24, minlength=self.time_bins)
         return hist / hist.sum()  # Normalize to probabilities
 
     def _analyze_content_distribution(
@@ -144,18 +290,18 @@ class ProfileSimulator:
         return {k: v / total for k, v in categories.items()}
 
     def _analyze_interval_distribution(
-        self, profile: List[Dict[str, Any]]
+        self,
+        profile: List[Dict[str, Any]],
+        times: Optional[np.ndarray] = None,
     ) -> np.ndarray:
         """Analyze the distribution of intervals between views."""
-        intervals = []
-        for i in range(1, len(profile)):
-            current = datetime.fromisoformat(profile[i]["timestamp"])
-            previous = datetime.fromisoformat(profile[i - 1]["timestamp"])
-            interval = (current - previous).total_seconds() / 60  # Convert to minutes
-            if interval < 24 * 60:  # Only consider intervals less than 24 hours
-                intervals.append(interval)
-
-        if not intervals:
+        if times is None:
+            times = self._parse_timestamps(profile)
+        intervals = np.diff(times) / np.timedelta64(1, "m")  # In minutes
+        # Only consider intervals less than 24 hours
+        intervals = intervals[intervals < 24 * 60]
+
+        if intervals.size == 0:
             return np.array([30])  # Default 30-minute interval if no data
 
         # Create histogram of intervals
@@ -163,15 +309,14 @@ class ProfileSimulator:
         return hist / hist.sum()  # Normalize to probabilities
 
     def _analyze_daily_counts(
-        self, profile: List[Dict[str, Any]]
+        self,
+        profile: List[Dict[str, Any]],
+        times: Optional[np.ndarray] = None,
     ) -> Tuple[float, float]:
         """Analyze the distribution of daily video counts."""
-        daily_counts = defaultdict(int)
-        for entry in profile:
-            date = datetime.fromisoformat(entry["timestamp"]).date()
-            daily_counts[date] += 1
-
-        counts = list(daily_counts.values())
+        if times is None:
+            times = self._parse_timestamps(profile)
+        _, counts = np.unique(times.astype("datetime64[D]"), return_counts=True)
         return np.mean(counts), np.std(counts)
 
     def _analyze_title_patterns(
@@ -194,11 +339,11 @@ class ProfileSimulator:
         # Common YouTube title patterns
         if " - " in title:
             patterns.append("CREATOR - CONTENT")
-        if re.search(r"EP\.?\s*\d+", title, re.I):
+        if _EPISODE_RE.search(title):
             patterns.append("SERIES_WITH_EPISODE")
-        if re.search(r"\(.*\)", title):
+        if _PARENTHESES_RE.search(title):
             patterns.append("TITLE_WITH_PARENTHESES")
-        if re.search(r"\[.*\]", title):
+        if _BRACKETS_RE.search(title):
             patterns.append("TITLE_WITH_BRACKETS")
         if not patterns:
             patterns.append("SIMPLE_TITLE")
@@ -210,31 +355,61 @@ class ProfileSimulator:
         count = int(self.rng.normal(mean, std))
         return max(1, count)  # Ensure at least 1 video per day
 
+    def _sample_daily_counts(
+        self, count_stats: Tuple[float, float], days: int
+    ) -> np.ndarray:
+        """Sample the number of videos watched on each of the given days."""
+        mean, std = count_stats
+        counts = self.rng.normal(mean, std, size=days).astype(int)
+        return np.maximum(counts, 1)  # Ensure at least 1 video per day
+
     def _sample_from_distribution(self, dist: np.ndarray) -> int:
         """Sample an index from a probability distribution."""
         return self.rng.choice(len(dist), p=dist / dist.sum())
 
+    def _sample_from_distribution_batch(self, dist: np.ndarray, n: int) -> np.ndarray:
+        """Sample n indices from a probability distribution in one call."""
+        return self.rng.choice(len(dist), size=n, p=dist / dist.sum())
+
     def _sample_from_dict(self, dist: Dict[str, float]) -> str:
         """Sample a key from a dictionary of probabilities."""
         keys = list(dist.keys())
         probs = list(dist.values())
         return self.rng.choice(keys, p=probs)
 
-    def _generate_title(self, patterns: Dict[str, List[str]], content_type: str) -> str:
-        """Generate a title based on learned patterns."""
+    def _sample_from_dict_batch(self, dist: Dict[str, float], n: int) -> List[str]:
+        """Sample n keys from a dictionary of probabilities in one call."""
+        return _AliasSampler(dist.keys(), dist.values()).draw_many(self.rng, n)
+
+    def _generate_title(
+        self,
+        patterns: Dict[str, List[str]],
+        content_type: str,
+        sampler: Optional[_AliasSampler] = None,
+    ) -> str:
+        """Generate a title based on learned patterns.
+
+        ``sampler`` is a pre-built sampler over ``patterns[content_type]``.
+        """
         if content_type not in patterns or not patterns[content_type]:
             return f"Simulated {content_type.title()} Video"
 
-        pattern = self.rng.choice(patterns[content_type])
+        if sampler is not None:
+            pattern = sampler.draw(self.rng)
+        else:
+            pattern = self.rng.choice(patterns[content_type])
 
         if pattern == "CREATOR - CONTENT":
             return (
-                f"Creator{self.rng.randint(1, 100)} - Content{self.rng.randint(1, 100)}"
+                f"Creator{self.rng.integers(1, 100)} - "
+                f"Content{self.rng.integers(1, 100)}"
             )
         if pattern == "SERIES_WITH_EPISODE":
-            return f"Series{self.rng.randint(1, 20)} EP.{self.rng.randint(1, 50)}"
+            return f"Series{self.rng.integers(1, 20)} EP.{self.rng.integers(1, 50)}"
         if pattern == "TITLE_WITH_PARENTHESES":
-            return f"Title{self.rng.randint(1, 100)} (Detail{self.rng.randint(1, 20)})"
+            return (
+                f"Title{self.rng.integers(1, 100)} (Detail{self.rng.integers(1, 20)})"
+            )
         if pattern == "TITLE_WITH_BRACKETS":
-            return f"Title{self.rng.randint(1, 100)} [Info{self.rng.randint(1, 20)}]"
-        return f"Simple Title {self.rng.randint(1, 1000)}"
+            return f"Title{self.rng.integers(1, 100)} [Info{self.rng.integers(1, 20)}]"
+        return f"Simple Title {self.rng.integers(1, 1000)}"
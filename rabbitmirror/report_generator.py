@@ -1,16 +1,35 @@
+import os
+import uuid
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
 import jinja2
 
 
+@lru_cache(maxsize=8)
+def _environment_for(template_dir: str, auto_reload: bool = True) -> jinja2.Environment:
+    """Return the shared Jinja environment for a template directory.
+
+    Generators for the same directory reuse one environment, so each template
+    is compiled once per process; the bytecode cache (a per-user directory
+    created by Jinja) also carries compiled templates across processes.
+    Without auto_reload, cached templates are served without checking
+    whether their source files changed.
+    """
+    return jinja2.Environment(
+        loader=jinja2.FileSystemLoader(template_dir),
+        autoescape=jinja2.select_autoescape(["html", "xml"]),
+        bytecode_cache=jinja2.FileSystemBytecodeCache(),
+        auto_reload=auto_reload,
+        cache_size=-1,
+    )
+
+
 class ReportGenerator:
-    def __init__(self, template_dir: str = "templates"):
-        self.env = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(template_dir),
-            autoescape=jinja2.select_autoescape(["html", "xml"]),
-        )
+    def __init__(self, template_dir: str = "templates", auto_reload: bool = True):
+        self.env = _environment_for(str(template_dir), auto_reload)
 
     def generate_report(
         self, data: Dict[str, Any], template_name: str, output_path: str
@@ -21,10 +40,19 @@ class ReportGenerator:
         # Add metadata to the report
         data["generated_at"] = datetime.now().isoformat()
 
-        # Render the template
-        output = template.render(**data)
-
-        # Save the report
+        # Stream the rendered template chunk by chunk into a file beside the
+        # report, and only move it into place once rendering has finished, so
+        # a template error part way through leaves no truncated report
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(output, encoding="utf-8")
+        partial_path = output_path.with_name(
+            f".{output_path.name}.{uuid.uuid4().hex}.tmp"
+        )
+        stream = template.stream(data)
+        stream.enable_buffering(size=16)
+        try:
+            stream.dump(str(partial_path), encoding="utf-8")
+            os.replace(partial_path, output_path)
+        except BaseException:
+            partial_path.unlink(missing_ok=True)
+            raise
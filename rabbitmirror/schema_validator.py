@@ -1,19 +1,172 @@
 #!/usr/bin/env python3
 
-from typing import Any, Dict, List, Optional
+import copy
+import json
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import jsonschema
 
 from .symbolic_logger import SymbolicLogger
 
+# fastjsonschema is an optional speedup for JSON-native data that validates;
+# failures are always reported by jsonschema so error messages stay the same
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover - optional dependency
+    fastjsonschema = None
+
+# Python types accepted for each JSON Schema type name by _matches_type
+_JSON_TYPES = {
+    "string": str,
+    "number": (int, float),
+    "integer": int,
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+    "null": type(None),
+}
+
+# Scalar types that round-trip through JSON unchanged
+_JSON_SCALARS = frozenset({str, int, float, bool, type(None)})
+_JSON_CONTAINERS = frozenset({dict, list})
+_JSON_TYPES_ALLOWED = _JSON_SCALARS | _JSON_CONTAINERS
+_STR_TYPE = frozenset({str})
+
+# Most recent validate_with_details results kept when result caching is on
+_RESULT_CACHE_SIZE = 256
+
+
+# Compiled validators are shared process-wide, keyed by the schema's canonical
+# JSON, so each distinct schema is checked and compiled only once
+_SHARED_VALIDATORS: Dict[str, jsonschema.protocols.Validator] = {}
+
+
+def _shared_validator(schema: Dict[str, Any]) -> jsonschema.protocols.Validator:
+    """Check a schema and build a validator for its draft, once per schema.
+
+    The validator is built from the schema as given rather than from the
+    sorted key: keyword order decides which error best_match reports.
+    """
+    key = json.dumps(schema, sort_keys=True)
+    validator = _SHARED_VALIDATORS.get(key)
+    if validator is None:
+        schema = copy.deepcopy(schema)
+        validator_class = jsonschema.validators.validator_for(schema)
+        validator_class.check_schema(schema)
+        validator = _SHARED_VALIDATORS.setdefault(key, validator_class(schema))
+    return validator
+
+
+@lru_cache(maxsize=None)
+def _compile_fast_json(schema_json: str) -> Optional[Callable[[Any], Any]]:
+    """Generate fastjsonschema code for a JSON-encoded schema, if supported."""
+    try:
+        # use_default=False keeps validation from filling defaults into data
+        return fastjsonschema.compile(json.loads(schema_json), use_default=False)
+    except fastjsonschema.JsonSchemaDefinitionException:
+        return None
+
+
+def _is_json_native(data: Any) -> bool:
+    """Check that data is built only from str-keyed dicts, lists and JSON scalars.
+
+    fastjsonschema also accepts tuples as arrays where jsonschema does not, so
+    only data shaped like parsed JSON may take the fast path.
+    """
+    data_type = type(data)
+    if data_type is dict:
+        if not _STR_TYPE.issuperset(map(type, data)):
+            return False
+        values = data.values()
+    elif data_type is list:
+        values = data
+    else:
+        return data_type in _JSON_SCALARS
+
+    # Check a container's value types in bulk and only descend into children
+    # that are containers themselves; cyclic data raises RecursionError, as
+    # jsonschema does
+    value_types = set(map(type, values))
+    if not _JSON_TYPES_ALLOWED.issuperset(value_types):
+        return False
+    if value_types.isdisjoint(_JSON_CONTAINERS):
+        return True
+    return all(
+        _is_json_native(value) for value in values if type(value) in _JSON_CONTAINERS
+    )
+
 
 class SchemaValidator:
     """Validates JSON data against predefined schemas for RabbitMirror data types."""
 
-    def __init__(self):
+    def __init__(self, cache_results: bool = False):
         self.schemas = self._load_schemas()
+        # Checked and compiled on first use of each schema, then reused;
+        # jsonschema.validate redoes both on every call
+        self._validators: Dict[str, jsonschema.protocols.Validator] = {}
+        self._fast_validators: Dict[str, Optional[Callable[[Any], Any]]] = {}
+        self._required_keys = {
+            schema_type: frozenset(schema.get("required", ()))
+            for schema_type, schema in self.schemas.items()
+        }
+        self._property_types = {
+            schema_type: {
+                prop: prop_schema.get("type")
+                for prop, prop_schema in schema.get("properties", {}).items()
+            }
+            for schema_type, schema in self.schemas.items()
+        }
+        self.cache_results = cache_results
+        self._result_cache: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = (
+            OrderedDict()
+        )
         self.logger = SymbolicLogger()
 
+    @staticmethod
+    def _compile_schema(schema: Dict[str, Any]) -> jsonschema.protocols.Validator:
+        """Build a validator for the schema's declared draft."""
+        return _shared_validator(schema)
+
+    @staticmethod
+    def _compile_fast(schema: Dict[str, Any]) -> Optional[Callable[[Any], Any]]:
+        """Generate a fastjsonschema validator, if available for the schema."""
+        if fastjsonschema is None:
+            return None
+        return _compile_fast_json(json.dumps(schema, sort_keys=True))
+
+    def _jsonschema_validator(self, schema_type: str) -> jsonschema.protocols.Validator:
+        """Return the compiled jsonschema validator for a schema type."""
+        validator = self._validators.get(schema_type)
+        if validator is None:
+            validator = self._compile_schema(self.schemas[schema_type])
+            self._validators[schema_type] = validator
+        return validator
+
+    def _fast_validator(self, schema_type: str) -> Optional[Callable[[Any], Any]]:
+        """Return the generated fastjsonschema validator for a schema type."""
+        if schema_type not in self._fast_validators:
+            self._fast_validators[schema_type] = self._compile_fast(
+                self.schemas[schema_type]
+            )
+        return self._fast_validators[schema_type]
+
+    def _first_error(
+        self, data: Dict[str, Any], schema_type: str
+    ) -> Optional[jsonschema.exceptions.ValidationError]:
+        """Return the error jsonschema.validate would raise, or None if valid."""
+        fast_validator = self._fast_validator(schema_type)
+        if fast_validator is not None and _is_json_native(data):
+            try:
+                fast_validator(data)
+                return None
+            except fastjsonschema.JsonSchemaException:
+                pass  # jsonschema decides, and describes the failure
+        return jsonschema.exceptions.best_match(
+            self._jsonschema_validator(schema_type).iter_errors(data)
+        )
+
     def _load_schemas(self) -> Dict[str, Dict[str, Any]]:
         """Load and return JSON schemas for different data types."""
         return {
@@ -257,7 +410,9 @@ class SchemaValidator:
         if not schema:
             raise ValueError(f"Schema not found for type: {schema_type}")
 
-        jsonschema.validate(instance=data, schema=schema)
+        error = self._first_error(data, schema_type)
+        if error is not None:
+            raise error
         self.logger.log_event(
             "validation_success",
             {"schema_type": schema_type, "data_size": len(str(data))},
@@ -276,21 +431,49 @@ class SchemaValidator:
                 "available_schemas": list(self.schemas.keys()),
             }
 
-        try:
-            jsonschema.validate(instance=data, schema=schema)
+        key = self._result_key(data, schema_type) if self.cache_results else None
+        if key is not None and key in self._result_cache:
+            self._result_cache.move_to_end(key)
+            return copy.deepcopy(self._result_cache[key])
+
+        result = self._validation_details(data, schema_type)
+        if key is not None:
+            # Snapshot the result so later edits to data cannot leak into it
+            self._result_cache[key] = copy.deepcopy(result)
+            if len(self._result_cache) > _RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        return result
+
+    def _validation_details(
+        self, data: Dict[str, Any], schema_type: str
+    ) -> Dict[str, Any]:
+        """Validate data against an existing schema and describe the outcome."""
+        error = self._first_error(data, schema_type)
+        if error is None:
             return {
                 "valid": True,
                 "schema_type": schema_type,
                 "message": "Data is valid",
             }
-        except jsonschema.exceptions.ValidationError as e:
-            return {
-                "valid": False,
-                "error": e.message,
-                "path": list(e.absolute_path),
-                "failed_value": e.instance,
-                "schema_type": schema_type,
-            }
+        return {
+            "valid": False,
+            "error": error.message,
+            "path": list(error.absolute_path),
+            "failed_value": error.instance,
+            "schema_type": schema_type,
+        }
+
+    @staticmethod
+    def _result_key(data: Any, schema_type: str) -> Optional[Tuple[str, str]]:
+        """Key a validation result by the data's canonical JSON form.
+
+        Content rather than identity is used, so mutated data is revalidated.
+        Returns None for data that is not JSON-native, since tuples or
+        non-str keys would serialize the same as lists or str keys.
+        """
+        if not _is_json_native(data):
+            return None
+        return schema_type, json.dumps(data, sort_keys=True)
 
     def get_available_schemas(self) -> List[str]:
         """Return list of available schema types."""
@@ -305,14 +488,26 @@ class SchemaValidator:
         schema_scores = {}
 
         for schema_type in self.schemas:
-            try:
-                self.validate(data, schema_type)
-                schema_scores[schema_type] = 100  # Perfect match
-            except (jsonschema.exceptions.ValidationError, ValueError):
+            score = 0
+            # An object missing a required top-level key cannot validate, so
+            # only schemas whose required keys are all present are tried in full
+            required = self._required_keys[schema_type]
+            if not isinstance(data, dict) or required.issubset(data):
+                try:
+                    self.validate(data, schema_type)
+                    score = 100  # Perfect match
+                except (jsonschema.exceptions.ValidationError, ValueError):
+                    pass
+
+            if score < 100:
                 # Calculate partial match score based on structure
                 score = self._calculate_structure_similarity(data, schema_type)
-                if score > 0:
-                    schema_scores[schema_type] = score
+
+            # Nothing outscores 100 and ties go to the earliest schema
+            if score == 100:
+                return schema_type
+            if score > 0:
+                schema_scores[schema_type] = score
 
         if not schema_scores:
             return None
@@ -325,49 +520,32 @@ class SchemaValidator:
         self, data: Dict[str, Any], schema_type: str
     ) -> int:
         """Calculate how similar the data structure is to a given schema (0-100)."""
-        schema = self.schemas.get(schema_type)
-        if not schema:
+        # Every schema describes an object, so other top-level values score 0
+        if not isinstance(data, dict) or not self.schemas.get(schema_type):
             return 0
 
-        score = 0
-        max_score = 0
-
-        # Check if required top-level properties exist
-        required_props = schema.get("required", [])
-        for prop in required_props:
-            max_score += 20
-            if prop in data:
-                score += 20
+        required_props = self._required_keys[schema_type]
+        property_types = self._property_types[schema_type]
+        max_score = 20 * len(required_props) + 10 * len(property_types)
+        if max_score == 0:
+            return 0
 
-        # Check if top-level properties match expected types
-        properties = schema.get("properties", {})
-        for prop, prop_schema in properties.items():
-            max_score += 10
-            if prop in data:
-                expected_type = prop_schema.get("type")
-                actual_value = data[prop]
+        # Required top-level properties that exist
+        score = 20 * len(required_props & data.keys())
 
-                if self._matches_type(actual_value, expected_type):
-                    score += 10
-                else:
-                    score += 5  # Partial credit for having the property
+        # Present top-level properties, with partial credit for a type mismatch
+        for prop in property_types.keys() & data.keys():
+            if self._matches_type(data[prop], property_types[prop]):
+                score += 10
+            else:
+                score += 5
 
-        return int((score / max_score * 100)) if max_score > 0 else 0
+        return int((score / max_score * 100))
 
     def _matches_type(self, value: Any, expected_type: str) -> bool:
         """Check if a value matches the expected JSON schema type."""
-        if expected_type == "string":
-            return isinstance(value, str)
-        if expected_type == "number":
-            return isinstance(value, (int, float))
-        if expected_type == "integer":
-            return isinstance(value, int)
-        if expected_type == "boolean":
-            return isinstance(value, bool)
-        if expected_type == "array":
-            return isinstance(value, list)
-        if expected_type == "object":
-            return isinstance(value, dict)
-        if expected_type == "null":
-            return value is None
-        return False
+        # Union types (lists of names) are not scored as a match
+        if not isinstance(expected_type, str):
+            return False
+        python_type = _JSON_TYPES.get(expected_type)
+        return python_type is not None and isinstance(value, python_type)
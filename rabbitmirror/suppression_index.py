@@ -54,9 +54,9 @@ class SuppressionIndex:
         self, entries: List[Dict[str, Any]]
     ) -> Dict[str, float]:
         """Calculate the distribution of content categories."""
-        categories = [entry.get("category", "unknown") for entry in entries]
-        counts = Counter(categories)
-        total = sum(counts.values())
+        counts = Counter(entry.get("category", "unknown") for entry in entries)
+        # Every entry contributes exactly one count
+        total = len(entries)
         return {cat: count / total for cat, count in counts.items()}
 
     def _calculate_view_velocity(self, entries: List[Dict[str, Any]]) -> float:
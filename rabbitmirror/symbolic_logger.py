@@ -1,9 +1,37 @@
 import json
+from datetime import date, time
 from pathlib import Path
 from typing import Any, Dict
 
 from loguru import logger
 
+# orjson is an optional speedup. The stdlib fallback emits the same compact
+# form, including ISO 8601 dates and times, except that NaN/Infinity are
+# written as-is rather than as null and floats keep Python's repr (1e+16
+# instead of 1e16).
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def _default(value: Any) -> str:
+    """Serialize dates and times the way orjson does."""
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dumps(data: Any) -> str:
+    """Serialize a log payload to compact JSON."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except orjson.JSONEncodeError:
+            # Let stdlib json handle (or reject) what orjson refuses
+            pass
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=_default)
+
 
 class SymbolicLogger:
     def __init__(self, log_dir: str = "logs"):
@@ -20,7 +48,7 @@ class SymbolicLogger:
 
     def log_event(self, event_type: str, data: Dict[str, Any]):
         """Log an event with structured data."""
-        logger.info(f"{event_type}: {json.dumps(data)}")
+        logger.info(f"{event_type}: {_dumps(data)}")
 
     def log_error(
         self, error_type: str, error: Exception, context: Dict[str, Any] = None
@@ -31,4 +59,4 @@ class SymbolicLogger:
             "error_message": str(error),
             "context": context or {},
         }
-        logger.error(f"Error: {json.dumps(error_data)}")
+        logger.error(f"Error: {_dumps(error_data)}")
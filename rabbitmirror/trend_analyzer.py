@@ -5,10 +5,12 @@ This module provides functionality to analyze temporal patterns, growth trends,
 and behavioral changes in viewing data across different time periods.
 """
 
+import warnings
 from collections import defaultdict
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
@@ -17,6 +19,15 @@ import numpy as np
 class TrendMetric:
     """Represents a trend metric with statistical information."""
 
+    __slots__ = (
+        "name",
+        "values",
+        "timeframes",
+        "trend_direction",
+        "trend_strength",
+        "statistical_significance",
+    )
+
     name: str
     values: List[float]
     timeframes: List[str]
@@ -29,6 +40,15 @@ class TrendMetric:
 class SignificantChange:
     """Represents a significant change detected in the data."""
 
+    __slots__ = (
+        "metric",
+        "timeframe",
+        "from_value",
+        "to_value",
+        "change_percentage",
+        "description",
+    )
+
     metric: str
     timeframe: str
     from_value: float
@@ -37,9 +57,71 @@ class SignificantChange:
     description: str
 
 
+def _parse_naive_timestamps(stamps: List[str]) -> Optional[np.ndarray]:
+    """Parse plain ISO timestamps into ``datetime64[us]`` in one NumPy call.
+
+    Returns None when any string carries a UTC offset or is not a form NumPy
+    parses the way ``datetime.fromisoformat`` would; callers then fall back
+    to per-entry parsing.
+    """
+    if not all(stamp[4:5] == "-" for stamp in stamps):
+        return None
+    try:
+        with warnings.catch_warnings():
+            # NumPy only warns when it drops a UTC offset
+            warnings.simplefilter("error")
+            times = np.array(stamps, dtype="datetime64[us]")
+    except (ValueError, UserWarning, DeprecationWarning):
+        return None
+    return None if np.isnat(times).any() else times
+
+
+def _parse_days(stamps: List[str]) -> np.ndarray:
+    """Parse ISO timestamps into a ``datetime64[D]`` array of calendar days.
+
+    Strings NumPy does not take as-is (UTC offsets, compact dates) go through
+    ``datetime.fromisoformat`` and keep their local wall-clock date.
+    """
+    times = _parse_naive_timestamps(stamps)
+    if times is not None:
+        return times.astype("datetime64[D]")
+    return np.array(
+        [datetime.fromisoformat(stamp).date() for stamp in stamps],
+        dtype="datetime64[D]",
+    )
+
+
+@lru_cache(maxsize=32)
+def _period_keys(period_type: str, day_bytes: bytes) -> Tuple[str, ...]:
+    """Format period keys for the raw bytes of a ``datetime64[D]`` array.
+
+    Keyed on the array contents so repeated analyses of the same history
+    reuse the formatted keys.
+    """
+    days = np.frombuffer(day_bytes, dtype="datetime64[D]")
+    if period_type == "daily":
+        return tuple(np.datetime_as_string(days, unit="D").tolist())
+    if period_type == "weekly":
+        # 1970-01-01 was a Thursday, so Monday-based weekdays are offset by 3
+        mondays = days - (days.astype(np.int64) + 3) % 7
+        years = mondays.astype("datetime64[Y]")
+        # %U week number of a Monday: Sunday-started weeks, day-of-year + 6
+        weeks = ((mondays - years).astype(np.int64) + 6) // 7
+        return tuple(
+            f"{year}-W{week:02d}"
+            for year, week in zip(np.datetime_as_string(years).tolist(), weeks.tolist())
+        )
+    if period_type == "monthly":
+        return tuple(np.datetime_as_string(days.astype("datetime64[M]")).tolist())
+    raise ValueError(f"Unsupported period type: {period_type}")
+
+
 class TrendAnalyzer:
     """Analyze trends and patterns in watch history data over time."""
 
+    _PERIOD_TYPES = ("daily", "weekly", "monthly")
+    _SUPPORTED_PERIODS = frozenset(_PERIOD_TYPES)
+
     def __init__(self, period_type: str = "daily", normalize: bool = False):
         """
         Initialize the TrendAnalyzer.
@@ -50,9 +132,9 @@ class TrendAnalyzer:
         """
         self.period_type = period_type
         self.normalize = normalize
-        self.supported_periods = ["daily", "weekly", "monthly"]
+        self.supported_periods = list(self._PERIOD_TYPES)
 
-        if period_type not in self.supported_periods:
+        if period_type not in self._SUPPORTED_PERIODS:
             raise ValueError(f"Period type must be one of {self.supported_periods}")
 
     def analyze_trends(
@@ -89,20 +171,21 @@ class TrendAnalyzer:
         # Calculate metrics for each time period
         period_metrics = self._calculate_period_metrics(time_periods)
 
-        # Analyze trends for each metric
-        trend_results = {}
-        significant_changes = []
-
-        for metric in analysis_metrics:
-            if metric in period_metrics:
-                trend_metric = self._analyze_metric_trend(
-                    metric, period_metrics[metric], list(time_periods.keys())
-                )
-                trend_results[metric] = trend_metric
+        # Analyze trends for all requested metrics at once
+        trend_results = self._analyze_metric_trends(
+            {
+                metric: period_metrics[metric]
+                for metric in analysis_metrics
+                if metric in period_metrics
+            },
+            list(time_periods.keys()),
+        )
 
-                # Detect significant changes
-                changes = self._detect_significant_changes(trend_metric)
-                significant_changes.extend(changes)
+        # Detect significant changes
+        significant_changes = []
+        for trend_metric in trend_results.values():
+            changes = self._detect_significant_changes(trend_metric)
+            significant_changes.extend(changes)
 
         return {
             "period_type": self.period_type,
@@ -125,16 +208,22 @@ class TrendAnalyzer:
         """Group entries by time period."""
         periods = defaultdict(list)
 
-        for entry in entries:
-            timestamp = datetime.fromisoformat(entry["timestamp"])
-            period_key = self._get_period_key(timestamp)
-            periods[period_key].append(entry)
+        # Period keys depend only on the calendar day, so derive one key per
+        # distinct day instead of formatting a key for every entry
+        days, day_index = np.unique(
+            _parse_days([entry["timestamp"] for entry in entries]),
+            return_inverse=True,
+        )
+        day_keys = self._get_period_keys(days)
+
+        for entry, index in zip(entries, day_index.tolist()):
+            periods[day_keys[index]].append(entry)
 
         # Sort periods chronologically
         sorted_periods = dict(sorted(periods.items()))
         return sorted_periods
 
-    def _get_period_key(self, timestamp: datetime) -> str:
+    def _get_period_key(self, timestamp: Union[date, datetime]) -> str:
         """Generate a period key based on the timestamp."""
         if self.period_type == "daily":
             return timestamp.strftime("%Y-%m-%d")
@@ -146,6 +235,14 @@ class TrendAnalyzer:
             return timestamp.strftime("%Y-%m")
         raise ValueError(f"Unsupported period type: {self.period_type}")
 
+    def _get_period_keys(self, days: np.ndarray) -> List[str]:
+        """Generate period keys for an array of ``datetime64[D]`` days.
+
+        Vectorized equivalent of calling ``_get_period_key`` for each day.
+        """
+        day_bytes = np.ascontiguousarray(days, dtype="datetime64[D]").tobytes()
+        return list(_period_keys(self.period_type, day_bytes))
+
     def _calculate_period_metrics(
         self, time_periods: Dict[str, List[Dict[str, Any]]]
     ) -> Dict[str, List[float]]:
@@ -153,11 +250,24 @@ class TrendAnalyzer:
         metrics = defaultdict(list)
 
         for _, entries in time_periods.items():
+            # Accumulate every per-entry reduction in a single pass
+            total_duration = 0
+            engagement_total = 0
+            has_engagement = False
+            channels = set()
+            categories = set()
+            for entry in entries:
+                total_duration += entry.get("duration", 0)
+                channels.add(entry.get("channel", "unknown"))
+                categories.add(entry.get("category", "unknown"))
+                if "engagement_score" in entry:
+                    engagement_total += entry["engagement_score"]
+                    has_engagement = True
+
             # Video count
             metrics["video_count"].append(len(entries))
 
             # Total duration
-            total_duration = sum(entry.get("duration", 0) for entry in entries)
             metrics["total_duration"].append(total_duration)
 
             # Average duration
@@ -165,11 +275,9 @@ class TrendAnalyzer:
             metrics["avg_duration"].append(avg_duration)
 
             # Unique channels
-            channels = set(entry.get("channel", "unknown") for entry in entries)
             metrics["unique_channels"].append(len(channels))
 
             # Category diversity (unique categories)
-            categories = set(entry.get("category", "unknown") for entry in entries)
             metrics["categories_diversity"].append(len(categories))
 
             # Viewing velocity (videos per hour of total content)
@@ -178,12 +286,9 @@ class TrendAnalyzer:
             )
             metrics["viewing_velocity"].append(viewing_velocity)
 
-            # Engagement metrics (if available)
-            if any("engagement_score" in entry for entry in entries):
-                engagement_scores = [
-                    entry.get("engagement_score", 0) for entry in entries
-                ]
-                metrics["avg_engagement"].append(np.mean(engagement_scores))
+            # Engagement metrics (if available; unscored entries count as 0)
+            if has_engagement:
+                metrics["avg_engagement"].append(engagement_total / len(entries))
 
             # Session metrics
             session_count = self._count_sessions(entries)
@@ -203,6 +308,12 @@ class TrendAnalyzer:
         if not timestamped_entries:
             return 1  # Assume single session if no timestamp data
 
+        # Plain ISO timestamps: count gaps over the threshold in one pass
+        times = _parse_naive_timestamps([e["timestamp"] for e in timestamped_entries])
+        if times is not None:
+            gap_minutes = np.diff(np.sort(times)) / np.timedelta64(1, "m")
+            return 1 + int(np.count_nonzero(gap_minutes > gap_threshold))
+
         # Sort entries by timestamp
         sorted_entries = sorted(
             timestamped_entries, key=lambda x: datetime.fromisoformat(x["timestamp"])
@@ -223,40 +334,88 @@ class TrendAnalyzer:
         self, metric_name: str, values: List[float], timeframes: List[str]
     ) -> TrendMetric:
         """Analyze trend for a specific metric."""
-        if len(values) < 2:
-            return TrendMetric(
-                name=metric_name,
-                values=values,
-                timeframes=timeframes,
-                trend_direction="stable",
-                trend_strength=0.0,
-                statistical_significance=0.0,
-            )
+        return self._analyze_metric_trends({metric_name: values}, timeframes)[
+            metric_name
+        ]
 
-        # Normalize values if requested
-        if self.normalize and max(values) > 0:
-            max_val = max(values)
-            normalized_values = [v / max_val for v in values]
-        else:
-            normalized_values = values
-
-        # Calculate trend direction and strength using linear regression
-        x = np.arange(len(values))
-        y = np.array(values)
-
-        # Simple linear regression
-        if len(values) > 1:
-            slope, _ = np.polyfit(x, y, 1)
-            # Check if arrays have zero variance before correlation calculation
-            if len(values) > 2 and np.std(x) > 0 and np.std(y) > 0:
-                correlation = np.corrcoef(x, y)[0, 1]
-            else:
-                correlation = 0.0
-        else:
-            slope, correlation = 0.0, 0.0
+    def _analyze_metric_trends(
+        self, metric_values: Dict[str, List[float]], timeframes: List[str]
+    ) -> Dict[str, TrendMetric]:
+        """Analyze trends for several metrics, batching series of equal length.
+
+        Each batch is stacked into one (metrics x periods) array, so slopes and
+        correlations for all of its metrics come from a few matrix reductions.
+        """
+        by_length = defaultdict(list)
+        for name, values in metric_values.items():
+            by_length[len(values)].append(name)
+
+        trends = {}
+        for length, names in by_length.items():
+            if length < 2:
+                for name in names:
+                    trends[name] = TrendMetric(
+                        name=name,
+                        values=metric_values[name],
+                        timeframes=timeframes,
+                        trend_direction="stable",
+                        trend_strength=0.0,
+                        statistical_significance=0.0,
+                    )
+                continue
+
+            # Closed-form least-squares slope and Pearson r per row, computed
+            # over the centered series
+            y = np.array([metric_values[name] for name in names], dtype=np.float64)
+            x_centered = np.arange(length) - (length - 1) / 2
+            y_centered = y - y.mean(axis=1, keepdims=True)
+            sxx = x_centered @ x_centered
+            sxy = y_centered @ x_centered
+            syy = np.einsum("ij,ij->i", y_centered, y_centered)
+
+            slopes = sxy / sxx
+            # Zero variance in y leaves the correlation undefined
+            correlations = np.zeros(len(names))
+            if length > 2:
+                varying = syy > 0
+                correlations[varying] = sxy[varying] / np.sqrt(sxx * syy[varying])
+            y_std = np.sqrt(syy / length)
+
+            # Normalize rows with a positive maximum to the 0-1 scale if requested
+            rows = [metric_values[name] for name in names]
+            if self.normalize:
+                maxima = y.max(axis=1)
+                scaled = y / np.where(maxima > 0, maxima, 1)[:, None]
+                rows = [
+                    scaled[i].tolist() if maxima[i] > 0 else rows[i]
+                    for i in range(len(names))
+                ]
 
+            for i, name in enumerate(names):
+                trends[name] = self._trend_metric(
+                    name,
+                    rows[i],
+                    timeframes,
+                    slopes[i],
+                    correlations[i],
+                    y_std[i],
+                )
+
+        # Keep the caller's metric order
+        return {name: trends[name] for name in metric_values}
+
+    def _trend_metric(
+        self,
+        metric_name: str,
+        values: List[float],
+        timeframes: List[str],
+        slope: float,
+        correlation: float,
+        y_std: float,
+    ) -> TrendMetric:
+        """Build a TrendMetric from a series' regression statistics."""
         # Determine trend direction
-        std_threshold = np.std(values) * 0.1 if np.std(values) > 0 else 0.01
+        std_threshold = y_std * 0.1 if y_std > 0 else 0.01
         if abs(slope) < std_threshold:
             direction = "stable"
         elif slope > 0:
@@ -272,7 +431,7 @@ class TrendAnalyzer:
 
         return TrendMetric(
             name=metric_name,
-            values=normalized_values if self.normalize else values,
+            values=values,
             timeframes=timeframes,
             trend_direction=direction,
             trend_strength=strength,
@@ -290,24 +449,32 @@ class TrendAnalyzer:
         if len(values) < 2:
             return changes
 
-        # Detect sudden changes (threshold: 50% change)
-        for i in range(1, len(values)):
-            if values[i - 1] != 0:  # Avoid division by zero
-                change_pct = ((values[i] - values[i - 1]) / values[i - 1]) * 100
-
-                if abs(change_pct) > 50:  # Significant change threshold
-                    direction = "increase" if change_pct > 0 else "decrease"
-                    changes.append(
-                        SignificantChange(
-                            metric=trend_metric.name,
-                            timeframe=timeframes[i],
-                            from_value=values[i - 1],
-                            to_value=values[i],
-                            change_percentage=change_pct,
-                            description=f"Significant {direction} of "
-                            f"{abs(change_pct):.1f}%",
-                        )
-                    )
+        # Detect sudden changes (threshold: 50% change), skipping zero bases
+        series = np.asarray(values, dtype=float)
+        previous, current = series[:-1], series[1:]
+        change_pcts = (
+            np.divide(
+                current - previous,
+                previous,
+                out=np.zeros_like(previous),
+                where=previous != 0,
+            )
+            * 100
+        )
+
+        for i in np.flatnonzero(np.abs(change_pcts) > 50).tolist():
+            change_pct = float(change_pcts[i])
+            direction = "increase" if change_pct > 0 else "decrease"
+            changes.append(
+                SignificantChange(
+                    metric=trend_metric.name,
+                    timeframe=timeframes[i + 1],
+                    from_value=values[i],
+                    to_value=values[i + 1],
+                    change_percentage=change_pct,
+                    description=f"Significant {direction} of {abs(change_pct):.1f}%",
+                )
+            )
 
         return changes
 
@@ -343,7 +510,17 @@ class TrendAnalyzer:
         if not entries:
             return {"start": None, "end": None}
 
-        timestamps = [datetime.fromisoformat(entry["timestamp"]) for entry in entries]
+        stamps = [entry["timestamp"] for entry in entries]
+        times = _parse_naive_timestamps(stamps)
+        if times is not None:
+            # Only the two extremes need a full datetime parse
+            first, last = int(times.argmin()), int(times.argmax())
+            return {
+                "start": datetime.fromisoformat(stamps[first]).isoformat(),
+                "end": datetime.fromisoformat(stamps[last]).isoformat(),
+            }
+
+        timestamps = [datetime.fromisoformat(stamp) for stamp in stamps]
         return {
             "start": min(timestamps).isoformat(),
             "end": max(timestamps).isoformat(),
@@ -1,4 +1,5 @@
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
 
@@ -607,3 +608,14 @@ def test_error_health_monitor():
     assert len(monitor.error_history) == 1
     assert monitor.get_error_rate() > 0
     assert monitor.is_system_healthy() is True
+
+
+def test_with_timeout_in_worker_thread():
+    """Test with_timeout runs functions called outside the main thread."""
+
+    @with_timeout(timeout_seconds=1.0)
+    def threaded_function():
+        return "success"
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(threaded_function).result() == "success"
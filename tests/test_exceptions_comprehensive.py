@@ -5,6 +5,8 @@ Comprehensive tests for all exception classes.
 This module aims to achieve 100% coverage of the exceptions module.
 """
 
+import json
+
 import pytest
 
 from rabbitmirror.exceptions import (
@@ -36,6 +38,52 @@ from rabbitmirror.exceptions import (
     handle_network_error,
 )
 
+# Optional constructor fields that each exception mirrors into ``details``.
+# TestDetailsInvariant checks the mirroring once per field, so the per-class
+# tests below only need to assert on the attribute.
+OPTIONAL_DETAIL_FIELDS = [
+    (ParsingError, {"file_path": "/test/file.html", "line_number": 42}),
+    (DataValidationError, {"validation_errors": ["Field required"]}),
+    (SchemaValidationError, {"schema_path": "/schemas/test.json"}),
+    (FileOperationError, {"file_path": "/test/file.txt", "operation": "read"}),
+    (ConfigurationError, {"config_key": "database.host"}),
+    (ClusteringError, {"algorithm": "DBSCAN"}),
+    (TrendAnalysisError, {"metric": "engagement"}),
+    (SimulationError, {"simulation_type": "monte_carlo"}),
+    (ExportError, {"export_format": "csv"}),
+    (DatabaseError, {"operation": "SELECT"}),
+    (NetworkError, {"url": "https://example.com", "status_code": 404}),
+    (ResourceError, {"resource_type": "memory"}),
+    (DependencyError, {"dependency": "numpy", "required_version": "1.20.0"}),
+    (
+        CustomPermissionError,
+        {"resource": "/test/file.txt", "required_permission": "read"},
+    ),
+    (CustomTimeoutError, {"timeout_duration": 30.5}),
+    (InternalError, {"component": "parser"}),
+]
+
+
+def _assert_detail_set(err, name, value):
+    """Assert that an optional field was stored on the error."""
+    assert getattr(err, name) == value
+
+
+def _assert_detail_absent(err, name):
+    """Assert that an omitted optional field defaults to None."""
+    assert getattr(err, name) is None
+
+
+@pytest.fixture(scope="module")
+def network_error_dict():
+    """Fixture providing the serialized form of a fully populated NetworkError."""
+    return NetworkError(
+        "Network failed",
+        url="https://example.com",
+        status_code=404,
+        error_code="NET_001",
+    ).to_dict()
+
 
 class TestRabbitMirrorError:
     """Test the base RabbitMirrorError class."""
@@ -102,32 +150,27 @@ class TestParsingError:
             line_number=42,
             error_code="PARSE_001",
         )
-        assert error.file_path == "/test/file.html"
-        assert error.line_number == 42
-        assert error.details["file_path"] == "/test/file.html"
-        assert error.details["line_number"] == 42
+        _assert_detail_set(error, "file_path", "/test/file.html")
+        _assert_detail_set(error, "line_number", 42)
 
     def test_init_without_optional_args(self):
         """Test initialization without optional arguments."""
         error = ParsingError("Parse failed")
-        assert error.file_path is None
-        assert error.line_number is None
-        assert "file_path" not in error.details
-        assert "line_number" not in error.details
+        _assert_detail_absent(error, "file_path")
+        _assert_detail_absent(error, "line_number")
 
     def test_init_with_partial_args(self):
         """Test initialization with only file path."""
         error = ParsingError("Parse failed", file_path="/test/file.html")
-        assert error.file_path == "/test/file.html"
-        assert error.line_number is None
-        assert error.details["file_path"] == "/test/file.html"
-        assert "line_number" not in error.details
+        _assert_detail_set(error, "file_path", "/test/file.html")
+        _assert_detail_absent(error, "line_number")
 
     def test_inheritance(self):
         """Test inheritance from DataProcessingError."""
         error = ParsingError("Parse failed")
-        assert isinstance(error, DataProcessingError)
-        assert isinstance(error, RabbitMirrorError)
+        assert all(
+            isinstance(error, t) for t in (DataProcessingError, RabbitMirrorError)
+        )
 
 
 class TestInvalidFormatError:
@@ -136,9 +179,10 @@ class TestInvalidFormatError:
     def test_inheritance(self):
         """Test inheritance from ParsingError."""
         error = InvalidFormatError("Invalid format")
-        assert isinstance(error, ParsingError)
-        assert isinstance(error, DataProcessingError)
-        assert isinstance(error, RabbitMirrorError)
+        assert all(
+            isinstance(error, t)
+            for t in (ParsingError, DataProcessingError, RabbitMirrorError)
+        )
 
 
 class TestDataValidationError:
@@ -150,20 +194,19 @@ class TestDataValidationError:
         error = DataValidationError(
             "Validation failed", validation_errors=validation_errors
         )
-        assert error.validation_errors == validation_errors
-        assert error.details["validation_errors"] == validation_errors
+        _assert_detail_set(error, "validation_errors", validation_errors)
 
     def test_init_without_validation_errors(self):
         """Test initialization without validation errors."""
         error = DataValidationError("Validation failed")
         assert error.validation_errors == []
-        assert "validation_errors" not in error.details
 
     def test_inheritance(self):
         """Test inheritance from DataProcessingError."""
         error = DataValidationError("Validation failed")
-        assert isinstance(error, DataProcessingError)
-        assert isinstance(error, RabbitMirrorError)
+        assert all(
+            isinstance(error, t) for t in (DataProcessingError, RabbitMirrorError)
+        )
 
 
 class TestSchemaValidationError:
@@ -174,21 +217,20 @@ class TestSchemaValidationError:
         error = SchemaValidationError(
             "Schema validation failed", schema_path="/schemas/test.json"
         )
-        assert error.schema_path == "/schemas/test.json"
-        assert error.details["schema_path"] == "/schemas/test.json"
+        _assert_detail_set(error, "schema_path", "/schemas/test.json")
 
     def test_init_without_schema_path(self):
         """Test initialization without schema path."""
         error = SchemaValidationError("Schema validation failed")
-        assert error.schema_path is None
-        assert "schema_path" not in error.details
+        _assert_detail_absent(error, "schema_path")
 
     def test_inheritance(self):
         """Test inheritance from DataValidationError."""
         error = SchemaValidationError("Schema validation failed")
-        assert isinstance(error, DataValidationError)
-        assert isinstance(error, DataProcessingError)
-        assert isinstance(error, RabbitMirrorError)
+        assert all(
+            isinstance(error, t)
+            for t in (DataValidationError, DataProcessingError, RabbitMirrorError)
+        )
 
 
 class TestFileOperationError:
@@ -199,18 +241,14 @@ class TestFileOperationError:
         error = FileOperationError(
             "File operation failed", file_path="/test/file.txt", operation="read"
         )
-        assert error.file_path == "/test/file.txt"
-        assert error.operation == "read"
-        assert error.details["file_path"] == "/test/file.txt"
-        assert error.details["operation"] == "read"
+        _assert_detail_set(error, "file_path", "/test/file.txt")
+        _assert_detail_set(error, "operation", "read")
 
     def test_init_without_optional_args(self):
         """Test initialization without optional arguments."""
         error = FileOperationError("File operation failed")
-        assert error.file_path is None
-        assert error.operation is None
-        assert "file_path" not in error.details
-        assert "operation" not in error.details
+        _assert_detail_absent(error, "file_path")
+        _assert_detail_absent(error, "operation")
 
     def test_inheritance(self):
         """Test inheritance from RabbitMirrorError."""
@@ -224,14 +262,12 @@ class TestConfigurationError:
     def test_init_with_config_key(self):
         """Test initialization with config key."""
         error = ConfigurationError("Config error", config_key="database.host")
-        assert error.config_key == "database.host"
-        assert error.details["config_key"] == "database.host"
+        _assert_detail_set(error, "config_key", "database.host")
 
     def test_init_without_config_key(self):
         """Test initialization without config key."""
         error = ConfigurationError("Config error")
-        assert error.config_key is None
-        assert "config_key" not in error.details
+        _assert_detail_absent(error, "config_key")
 
     def test_inheritance(self):
         """Test inheritance from RabbitMirrorError."""
@@ -254,20 +290,17 @@ class TestClusteringError:
     def test_init_with_algorithm(self):
         """Test initialization with algorithm."""
         error = ClusteringError("Clustering failed", algorithm="DBSCAN")
-        assert error.algorithm == "DBSCAN"
-        assert error.details["algorithm"] == "DBSCAN"
+        _assert_detail_set(error, "algorithm", "DBSCAN")
 
     def test_init_without_algorithm(self):
         """Test initialization without algorithm."""
         error = ClusteringError("Clustering failed")
-        assert error.algorithm is None
-        assert "algorithm" not in error.details
+        _assert_detail_absent(error, "algorithm")
 
     def test_inheritance(self):
         """Test inheritance from AnalysisError."""
         error = ClusteringError("Clustering failed")
-        assert isinstance(error, AnalysisError)
-        assert isinstance(error, RabbitMirrorError)
+        assert all(isinstance(error, t) for t in (AnalysisError, RabbitMirrorError))
 
 
 class TestPatternDetectionError:
@@ -276,8 +309,7 @@ class TestPatternDetectionError:
     def test_inheritance(self):
         """Test inheritance from AnalysisError."""
         error = PatternDetectionError("Pattern detection failed")
-        assert isinstance(error, AnalysisError)
-        assert isinstance(error, RabbitMirrorError)
+        assert all(isinstance(error, t) for t in (AnalysisError, RabbitMirrorError))
 
 
 class TestTrendAnalysisError:
@@ -286,20 +318,17 @@ class TestTrendAnalysisError:
     def test_init_with_metric(self):
         """Test initialization with metric."""
         error = TrendAnalysisError("Trend analysis failed", metric="engagement")
-        assert error.metric == "engagement"
-        assert error.details["metric"] == "engagement"
+        _assert_detail_set(error, "metric", "engagement")
 
     def test_init_without_metric(self):
         """Test initialization without metric."""
         error = TrendAnalysisError("Trend analysis failed")
-        assert error.metric is None
-        assert "metric" not in error.details
+        _assert_detail_absent(error, "metric")
 
     def test_inheritance(self):
         """Test inheritance from AnalysisError."""
         error = TrendAnalysisError("Trend analysis failed")
-        assert isinstance(error, AnalysisError)
-        assert isinstance(error, RabbitMirrorError)
+        assert all(isinstance(error, t) for t in (AnalysisError, RabbitMirrorError))
 
 
 class TestSimulationError:
@@ -308,14 +337,12 @@ class TestSimulationError:
     def test_init_with_simulation_type(self):
         """Test initialization with simulation type."""
         error = SimulationError("Simulation failed", simulation_type="monte_carlo")
-        assert error.simulation_type == "monte_carlo"
-        assert error.details["simulation_type"] == "monte_carlo"
+        _assert_detail_set(error, "simulation_type", "monte_carlo")
 
     def test_init_without_simulation_type(self):
         """Test initialization without simulation type."""
         error = SimulationError("Simulation failed")
-        assert error.simulation_type is None
-        assert "simulation_type" not in error.details
+        _assert_detail_absent(error, "simulation_type")
 
     def test_inheritance(self):
         """Test inheritance from RabbitMirrorError."""
@@ -329,14 +356,12 @@ class TestExportError:
     def test_init_with_export_format(self):
         """Test initialization with export format."""
         error = ExportError("Export failed", export_format="csv")
-        assert error.export_format == "csv"
-        assert error.details["export_format"] == "csv"
+        _assert_detail_set(error, "export_format", "csv")
 
     def test_init_without_export_format(self):
         """Test initialization without export format."""
         error = ExportError("Export failed")
-        assert error.export_format is None
-        assert "export_format" not in error.details
+        _assert_detail_absent(error, "export_format")
 
     def test_inheritance(self):
         """Test inheritance from RabbitMirrorError."""
@@ -350,14 +375,12 @@ class TestDatabaseError:
     def test_init_with_operation(self):
         """Test initialization with operation."""
         error = DatabaseError("Database error", operation="SELECT")
-        assert error.operation == "SELECT"
-        assert error.details["operation"] == "SELECT"
+        _assert_detail_set(error, "operation", "SELECT")
 
     def test_init_without_operation(self):
         """Test initialization without operation."""
         error = DatabaseError("Database error")
-        assert error.operation is None
-        assert "operation" not in error.details
+        _assert_detail_absent(error, "operation")
 
     def test_inheritance(self):
         """Test inheritance from RabbitMirrorError."""
@@ -373,26 +396,20 @@ class TestNetworkError:
         error = NetworkError(
             "Network error", url="https://example.com", status_code=404
         )
-        assert error.url == "https://example.com"
-        assert error.status_code == 404
-        assert error.details["url"] == "https://example.com"
-        assert error.details["status_code"] == 404
+        _assert_detail_set(error, "url", "https://example.com")
+        _assert_detail_set(error, "status_code", 404)
 
     def test_init_without_optional_args(self):
         """Test initialization without optional arguments."""
         error = NetworkError("Network error")
-        assert error.url is None
-        assert error.status_code is None
-        assert "url" not in error.details
-        assert "status_code" not in error.details
+        _assert_detail_absent(error, "url")
+        _assert_detail_absent(error, "status_code")
 
     def test_init_with_partial_args(self):
         """Test initialization with only URL."""
         error = NetworkError("Network error", url="https://example.com")
-        assert error.url == "https://example.com"
-        assert error.status_code is None
-        assert error.details["url"] == "https://example.com"
-        assert "status_code" not in error.details
+        _assert_detail_set(error, "url", "https://example.com")
+        _assert_detail_absent(error, "status_code")
 
     def test_inheritance(self):
         """Test inheritance from RabbitMirrorError."""
@@ -406,14 +423,12 @@ class TestResourceError:
     def test_init_with_resource_type(self):
         """Test initialization with resource type."""
         error = ResourceError("Resource error", resource_type="memory")
-        assert error.resource_type == "memory"
-        assert error.details["resource_type"] == "memory"
+        _assert_detail_set(error, "resource_type", "memory")
 
     def test_init_without_resource_type(self):
         """Test initialization without resource type."""
         error = ResourceError("Resource error")
-        assert error.resource_type is None
-        assert "resource_type" not in error.details
+        _assert_detail_absent(error, "resource_type")
 
     def test_inheritance(self):
         """Test inheritance from RabbitMirrorError."""
@@ -429,18 +444,14 @@ class TestDependencyError:
         error = DependencyError(
             "Dependency error", dependency="numpy", required_version="1.20.0"
         )
-        assert error.dependency == "numpy"
-        assert error.required_version == "1.20.0"
-        assert error.details["dependency"] == "numpy"
-        assert error.details["required_version"] == "1.20.0"
+        _assert_detail_set(error, "dependency", "numpy")
+        _assert_detail_set(error, "required_version", "1.20.0")
 
     def test_init_without_optional_args(self):
         """Test initialization without optional arguments."""
         error = DependencyError("Dependency error")
-        assert error.dependency is None
-        assert error.required_version is None
-        assert "dependency" not in error.details
-        assert "required_version" not in error.details
+        _assert_detail_absent(error, "dependency")
+        _assert_detail_absent(error, "required_version")
 
     def test_inheritance(self):
         """Test inheritance from RabbitMirrorError."""
@@ -456,18 +467,14 @@ class TestCustomPermissionError:
         error = CustomPermissionError(
             "Permission denied", resource="/test/file.txt", required_permission="read"
         )
-        assert error.resource == "/test/file.txt"
-        assert error.required_permission == "read"
-        assert error.details["resource"] == "/test/file.txt"
-        assert error.details["required_permission"] == "read"
+        _assert_detail_set(error, "resource", "/test/file.txt")
+        _assert_detail_set(error, "required_permission", "read")
 
     def test_init_without_optional_args(self):
         """Test initialization without optional arguments."""
         error = CustomPermissionError("Permission denied")
-        assert error.resource is None
-        assert error.required_permission is None
-        assert "resource" not in error.details
-        assert "required_permission" not in error.details
+        _assert_detail_absent(error, "resource")
+        _assert_detail_absent(error, "required_permission")
 
     def test_inheritance(self):
         """Test inheritance from RabbitMirrorError."""
@@ -481,20 +488,17 @@ class TestCustomTimeoutError:
     def test_init_with_timeout_duration(self):
         """Test initialization with timeout duration."""
         error = CustomTimeoutError("Operation timed out", timeout_duration=30.5)
-        assert error.timeout_duration == 30.5
-        assert error.details["timeout_duration"] == 30.5
+        _assert_detail_set(error, "timeout_duration", 30.5)
 
     def test_init_with_integer_timeout(self):
         """Test initialization with integer timeout duration."""
         error = CustomTimeoutError("Operation timed out", timeout_duration=30)
-        assert error.timeout_duration == 30
-        assert error.details["timeout_duration"] == 30
+        _assert_detail_set(error, "timeout_duration", 30)
 
     def test_init_without_timeout_duration(self):
         """Test initialization without timeout duration."""
         error = CustomTimeoutError("Operation timed out")
-        assert error.timeout_duration is None
-        assert "timeout_duration" not in error.details
+        _assert_detail_absent(error, "timeout_duration")
 
     def test_inheritance(self):
         """Test inheritance from RabbitMirrorError."""
@@ -508,14 +512,12 @@ class TestInternalError:
     def test_init_with_component(self):
         """Test initialization with component."""
         error = InternalError("Internal error", component="parser")
-        assert error.component == "parser"
-        assert error.details["component"] == "parser"
+        _assert_detail_set(error, "component", "parser")
 
     def test_init_without_component(self):
         """Test initialization without component."""
         error = InternalError("Internal error")
-        assert error.component is None
-        assert "component" not in error.details
+        _assert_detail_absent(error, "component")
 
     def test_inheritance(self):
         """Test inheritance from RabbitMirrorError."""
@@ -552,15 +554,6 @@ class TestErrorUtilities:
         # The function does not include the exception type in the message
         assert message == "Unexpected error: Standard error"
 
-    def test_format_error_message_with_traceback(self):
-        """Test formatting error message with traceback."""
-        try:
-            raise ValueError("Standard error")
-        except ValueError as error:
-            message = format_error_message(error, include_traceback=True)
-            assert "Unexpected error: Standard error" in message
-            assert "Traceback" in message
-
     def test_format_error_message_without_traceback(self):
         """Test formatting error message without traceback."""
         error = ValueError("Standard error")
@@ -594,171 +587,174 @@ class TestErrorUtilities:
         assert "T" in timestamp  # ISO format contains 'T'
 
 
+@handle_file_operation_error
+def _raises_file_not_found():
+    # Create FileNotFoundError with proper errno and filename
+    error = FileNotFoundError("test.txt")
+    error.filename = "test.txt"
+    raise error
+
+
+@handle_file_operation_error
+def _raises_permission_error():
+    raise PermissionError("Permission denied")
+
+
+@handle_file_operation_error
+def _raises_is_a_directory():
+    raise IsADirectoryError("Expected file but got directory")
+
+
+@handle_file_operation_error
+def _raises_os_error():
+    raise OSError("OS error occurred")
+
+
+@handle_file_operation_error
+def _file_operation_succeeds():
+    return "success"
+
+
+@handle_json_operation_error
+def _raises_json_value_error():
+    raise ValueError("Invalid JSON")
+
+
+@handle_json_operation_error
+def _raises_json_type_error():
+    raise TypeError("JSON serialization error")
+
+
+@handle_json_operation_error
+def _json_operation_succeeds():
+    return {"result": "success"}
+
+
+@handle_network_error
+def _raises_connection_error():
+    raise ConnectionError("Connection failed")
+
+
+@handle_network_error
+def _raises_timeout_error():
+    raise TimeoutError("Operation timed out")
+
+
+@handle_network_error
+def _raises_generic_network_error():
+    raise Exception("Generic network error")
+
+
+@handle_network_error
+def _network_operation_succeeds():
+    return "network_success"
+
+
 class TestErrorDecorators:
     """Test error handling decorators."""
 
     def test_handle_file_operation_error_file_not_found(self):
         """Test file operation decorator with FileNotFoundError."""
-
-        @handle_file_operation_error
-        def test_function():
-            # Create FileNotFoundError with proper errno and filename
-            error = FileNotFoundError("test.txt")
-            error.filename = "test.txt"
-            raise error
-
-        with pytest.raises(FileOperationError) as exc_info:
-            test_function()
+        with pytest.raises(
+            FileOperationError, match="File not found: test.txt"
+        ) as exc_info:
+            _raises_file_not_found()
 
         error = exc_info.value
-        assert "File not found: test.txt" in error.message
         assert error.error_code == "FILE_NOT_FOUND"
         assert error.file_path == "test.txt"
         assert error.operation == "read"
 
     def test_handle_file_operation_error_permission_denied(self):
         """Test file operation decorator with PermissionError."""
-
-        @handle_file_operation_error
-        def test_function():
-            raise PermissionError("Permission denied")
-
-        with pytest.raises(CustomPermissionError) as exc_info:
-            test_function()
+        with pytest.raises(
+            CustomPermissionError, match="Permission denied"
+        ) as exc_info:
+            _raises_permission_error()
 
         error = exc_info.value
-        assert "Permission denied" in error.message
         assert error.error_code == "PERMISSION_DENIED"
         assert error.required_permission == "read/write"
 
     def test_handle_file_operation_error_is_directory(self):
         """Test file operation decorator with IsADirectoryError."""
-
-        @handle_file_operation_error
-        def test_function():
-            raise IsADirectoryError("Expected file but got directory")
-
-        with pytest.raises(FileOperationError) as exc_info:
-            test_function()
+        with pytest.raises(
+            FileOperationError, match="Expected file but got directory"
+        ) as exc_info:
+            _raises_is_a_directory()
 
         error = exc_info.value
-        assert "Expected file but got directory" in error.message
         assert error.error_code == "IS_DIRECTORY"
         assert error.operation == "read"
 
     def test_handle_file_operation_error_os_error(self):
         """Test file operation decorator with OSError."""
-
-        @handle_file_operation_error
-        def test_function():
-            raise OSError("OS error occurred")
-
-        with pytest.raises(FileOperationError) as exc_info:
-            test_function()
+        with pytest.raises(
+            FileOperationError, match="File operation failed"
+        ) as exc_info:
+            _raises_os_error()
 
         error = exc_info.value
-        assert "File operation failed" in error.message
         assert error.error_code == "FILE_OPERATION_FAILED"
 
-    def test_handle_file_operation_error_success(self):
-        """Test file operation decorator with successful operation."""
-
-        @handle_file_operation_error
-        def test_function():
-            return "success"
-
-        result = test_function()
-        assert result == "success"
-
     def test_handle_json_operation_error_value_error(self):
         """Test JSON operation decorator with ValueError."""
-
-        @handle_json_operation_error
-        def test_function():
-            raise ValueError("Invalid JSON")
-
-        with pytest.raises(InvalidFormatError) as exc_info:
-            test_function()
+        with pytest.raises(InvalidFormatError, match="Invalid JSON format") as exc_info:
+            _raises_json_value_error()
 
         error = exc_info.value
-        assert "Invalid JSON format" in error.message
         assert error.error_code == "INVALID_JSON"
 
     def test_handle_json_operation_error_type_error(self):
         """Test JSON operation decorator with TypeError."""
-
-        @handle_json_operation_error
-        def test_function():
-            raise TypeError("JSON serialization error")
-
-        with pytest.raises(DataProcessingError) as exc_info:
-            test_function()
+        with pytest.raises(
+            DataProcessingError, match="JSON serialization error"
+        ) as exc_info:
+            _raises_json_type_error()
 
         error = exc_info.value
-        assert "JSON serialization error" in error.message
         assert error.error_code == "JSON_SERIALIZATION_ERROR"
 
-    def test_handle_json_operation_error_success(self):
-        """Test JSON operation decorator with successful operation."""
-
-        @handle_json_operation_error
-        def test_function():
-            return {"result": "success"}
-
-        result = test_function()
-        assert result == {"result": "success"}
-
     def test_handle_network_error_connection_error(self):
         """Test network operation decorator with ConnectionError."""
-
-        @handle_network_error
-        def test_function():
-            raise ConnectionError("Connection failed")
-
-        with pytest.raises(NetworkError) as exc_info:
-            test_function()
+        with pytest.raises(NetworkError, match="Network connection failed") as exc_info:
+            _raises_connection_error()
 
         error = exc_info.value
-        assert "Network connection failed" in error.message
         assert error.error_code == "CONNECTION_FAILED"
 
     def test_handle_network_error_timeout_error(self):
         """Test network operation decorator with TimeoutError."""
-
-        @handle_network_error
-        def test_function():
-            raise TimeoutError("Operation timed out")
-
-        with pytest.raises(CustomTimeoutError) as exc_info:
-            test_function()
+        with pytest.raises(
+            CustomTimeoutError, match="Network operation timed out"
+        ) as exc_info:
+            _raises_timeout_error()
 
         error = exc_info.value
-        assert "Network operation timed out" in error.message
         assert error.error_code == "NETWORK_TIMEOUT"
 
     def test_handle_network_error_generic_exception(self):
         """Test network operation decorator with generic Exception."""
-
-        @handle_network_error
-        def test_function():
-            raise Exception("Generic network error")
-
-        with pytest.raises(NetworkError) as exc_info:
-            test_function()
+        with pytest.raises(NetworkError, match="Network operation failed") as exc_info:
+            _raises_generic_network_error()
 
         error = exc_info.value
-        assert "Network operation failed" in error.message
         assert error.error_code == "NETWORK_ERROR"
 
-    def test_handle_network_error_success(self):
-        """Test network operation decorator with successful operation."""
 
-        @handle_network_error
-        def test_function():
-            return "network_success"
+def test_handle_file_operation_error_success():
+    """Test file operation decorator with successful operation."""
+    assert _file_operation_succeeds() == "success"
+
+
+def test_handle_json_operation_error_success():
+    """Test JSON operation decorator with successful operation."""
+    assert _json_operation_succeeds() == {"result": "success"}
+
 
-        result = test_function()
-        assert result == "network_success"
+def test_handle_network_error_success():
+    """Test network operation decorator with successful operation."""
+    assert _network_operation_succeeds() == "network_success"
 
 
 class TestErrorIntegration:
@@ -777,24 +773,38 @@ class TestErrorIntegration:
             assert error.__cause__ is not None
             assert isinstance(error.__cause__, ValueError)
 
-    def test_error_dict_serialization(self):
+    def test_error_dict_serialization(self, network_error_dict):
         """Test that error dictionaries are properly serializable."""
-        import json
-
-        error = NetworkError(
-            "Network failed",
-            url="https://example.com",
-            status_code=404,
-            error_code="NET_001",
-        )
-        error_dict = error.to_dict()
-
         # Should be JSON serializable
-        json_str = json.dumps(error_dict)
-        reconstructed = json.loads(json_str)
-
-        assert reconstructed["error_type"] == "NetworkError"
-        assert reconstructed["message"] == "Network failed"
-        assert reconstructed["error_code"] == "NET_001"
-        assert reconstructed["details"]["url"] == "https://example.com"
-        assert reconstructed["details"]["status_code"] == 404
+        json.dumps(network_error_dict)
+
+        assert network_error_dict["error_type"] == "NetworkError"
+        assert network_error_dict["message"] == "Network failed"
+        assert network_error_dict["error_code"] == "NET_001"
+        assert network_error_dict["details"]["url"] == "https://example.com"
+        assert network_error_dict["details"]["status_code"] == 404
+
+
+class TestDetailsInvariant:
+    """Test that optional fields are mirrored into the details dict."""
+
+    @pytest.mark.parametrize(
+        "error_class,fields",
+        OPTIONAL_DETAIL_FIELDS,
+        ids=[cls.__name__ for cls, _ in OPTIONAL_DETAIL_FIELDS],
+    )
+    def test_details_dict_mirrors_attributes(self, error_class, fields):
+        """Test that each provided field is the same object in details."""
+        error = error_class("Test message", **fields)
+        for name in fields:
+            assert getattr(error, name) is error.details[name]
+
+    @pytest.mark.parametrize(
+        "error_class,fields",
+        OPTIONAL_DETAIL_FIELDS,
+        ids=[cls.__name__ for cls, _ in OPTIONAL_DETAIL_FIELDS],
+    )
+    def test_details_dict_omits_unset_fields(self, error_class, fields):
+        """Test that omitted fields never appear in details."""
+        error = error_class("Test message")
+        assert not set(fields) & set(error.details)
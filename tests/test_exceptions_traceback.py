@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+
+"""
+Tests for error formatting paths that render a live traceback.
+
+These are kept apart from test_exceptions_comprehensive.py because
+traceback.format_exc() populates linecache from source files on disk,
+which the rest of the exception tests never need.
+"""
+
+from rabbitmirror.exceptions import format_error_message
+
+
+class TestFormatErrorMessageTraceback:
+    """Test format_error_message with include_traceback enabled."""
+
+    def test_format_error_message_with_traceback(self):
+        """Test formatting error message with traceback."""
+        try:
+            raise ValueError("Standard error")
+        except ValueError as error:
+            message = format_error_message(error, include_traceback=True)
+            assert "Unexpected error: Standard error" in message
+            assert "Traceback" in message
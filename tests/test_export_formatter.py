@@ -1,12 +1,14 @@
 import json
+from datetime import datetime
 from pathlib import Path
 
 import pandas as pd
 import pytest
 import yaml
+from openpyxl import load_workbook
 
 from rabbitmirror.exceptions import ExportError, FileOperationError, InvalidFormatError
-from rabbitmirror.export_formatter import ExportFormatter
+from rabbitmirror.export_formatter import _XLSX_DIRECT_WRITE_ROWS, ExportFormatter
 
 
 @pytest.fixture
@@ -175,6 +177,24 @@ class TestExportFormatter:
 
         assert flat_dict == expected
 
+    def test_flatten_dict_deep_nesting_preserves_order(self, temp_export_dir):
+        """Test _flatten_dict beyond the recursion limit keeps key order."""
+        formatter = ExportFormatter(output_dir=temp_export_dir)
+
+        deep = leaf = {}
+        for _ in range(2000):
+            leaf["n"] = {}
+            leaf = leaf["n"]
+        leaf["value"] = 1
+
+        flat_dict = formatter._flatten_dict({"first": 0, "deep": deep, "last": 2})
+
+        assert list(flat_dict) == [
+            "first",
+            "deep" + "_n" * 2000 + "_value",
+            "last",
+        ]
+
     def test_export_list_of_dicts(self, temp_export_dir):
         """Test exporting a list of dictionaries directly."""
         formatter = ExportFormatter(output_dir=temp_export_dir)
@@ -266,3 +286,233 @@ class TestExportFormatter:
 
         output_excel = formatter._export_excel(empty_entries, "empty_excel_test")
         assert Path(output_excel).exists()
+
+    def test_export_excel_heterogeneous_records(self, temp_export_dir):
+        """Test Excel export when records do not share the same keys."""
+        formatter = ExportFormatter(output_dir=temp_export_dir)
+
+        records = [
+            {"title": "Video 1", "views": 1000},
+            {"title": "Video 2", "channel": "Channel B"},
+        ]
+
+        output_excel = formatter._export_excel(records, "mixed_excel_test")
+        df = pd.read_excel(output_excel)
+        assert df.columns.tolist() == ["title", "views", "channel"]
+        assert df["title"].tolist() == ["Video 1", "Video 2"]
+        assert pd.isna(df.loc[1, "views"])
+        assert pd.isna(df.loc[0, "channel"])
+
+    def test_export_json_non_string_keys(self, temp_export_dir):
+        """Test JSON export coerces non-string keys like stdlib json."""
+        formatter = ExportFormatter(output_dir=temp_export_dir)
+        output_path = formatter._export_json({1: "a", "b": [1, 2]}, "keys_test")
+
+        with open(output_path, "r", encoding="utf-8") as f:
+            assert json.load(f) == {"1": "a", "b": [1, 2]}
+
+    def test_load_json_with_nan_literal(self, temp_export_dir):
+        """Test loading JSON that uses the non-standard NaN literal."""
+        filename = temp_export_dir / "nan.json"
+        filename.write_text('{"score": NaN, "count": 3}')
+
+        formatter = ExportFormatter()
+        loaded_data = formatter.load_data(filename)
+
+        assert loaded_data["count"] == 3
+        assert loaded_data["score"] != loaded_data["score"]
+
+    def test_export_overwrites_longer_file(self, temp_export_dir):
+        """Test JSON/YAML export truncates a previous, longer export."""
+        formatter = ExportFormatter(output_dir=temp_export_dir)
+        long_data = {"entries": [{"title": "Vidéo " * 100}]}
+        short_data = {"title": "Vidéo"}
+
+        for export in (formatter._export_json, formatter._export_yaml):
+            export(long_data, "overwrite_test")
+            output_path = export(short_data, "overwrite_test")
+            with open(output_path, "r", encoding="utf-8") as f:
+                assert yaml.safe_load(f) == short_data
+
+    def test_export_many(self, sample_data, temp_export_dir):
+        """Test exporting to several formats at once."""
+        formatter = ExportFormatter(output_dir=temp_export_dir)
+        paths = formatter.export_many(sample_data, ["json", "csv", "excel"], "multi")
+
+        assert set(paths) == {"json", "csv", "excel"}
+        assert [Path(p).suffix for p in paths.values()] == [".json", ".csv", ".xlsx"]
+        assert all(Path(p).exists() for p in paths.values())
+        with open(paths["json"], "r") as f:
+            assert json.load(f) == sample_data
+
+    def test_export_many_unsupported_format(self, sample_data, temp_export_dir):
+        """Test export_many surfaces errors from individual formats."""
+        formatter = ExportFormatter(output_dir=temp_export_dir)
+        with pytest.raises(ExportError, match="Unsupported export format"):
+            formatter.export_many(sample_data, ["json", "bogus"], "multi")
+
+    def test_load_excel_data_matches_pandas(self, temp_export_dir):
+        """Test streamed Excel loading matches pandas for gaps and headers."""
+        filename = temp_export_dir / "gaps.xlsx"
+        pd.DataFrame(
+            {
+                "views": [1, None, 3],
+                "title": ["Video 1", None, "Video 3"],
+                "rating": [4.5, 3.0, None],
+            }
+        ).to_excel(filename, index=False)
+
+        formatter = ExportFormatter()
+        loaded_data = formatter.load_data(filename)
+
+        expected = pd.read_excel(filename).to_dict(orient="dict")
+        assert list(loaded_data) == list(expected)
+        assert pd.DataFrame(loaded_data).equals(pd.DataFrame(expected))
+
+    @pytest.mark.parametrize("export_format", ["parquet", "feather"])
+    def test_export_and_load_columnar_formats(
+        self, sample_data, temp_export_dir, export_format
+    ):
+        """Test Parquet/Feather round trips through export_data and load_data."""
+        pytest.importorskip("pyarrow")
+        formatter = ExportFormatter(output_dir=temp_export_dir)
+        output_path = formatter.export_data(sample_data, export_format, "columnar")
+
+        assert Path(output_path).suffix == f".{export_format}"
+        loaded_data = formatter.load_data(output_path)
+        assert loaded_data == pd.DataFrame(sample_data["entries"]).to_dict()
+
+    def test_columnar_format_without_pyarrow(
+        self, sample_data, temp_export_dir, monkeypatch
+    ):
+        """Test Parquet export reports the missing optional dependency."""
+        monkeypatch.setattr("rabbitmirror.export_formatter.pyarrow", None)
+        formatter = ExportFormatter(output_dir=temp_export_dir)
+
+        with pytest.raises(ExportError, match="requires pyarrow"):
+            formatter.export_data(sample_data, "parquet", "columnar")
+
+    def test_to_dataframe_categorizes_repeated_strings(self, temp_export_dir):
+        """Test repeated string columns become categoricals for columnar export."""
+        formatter = ExportFormatter(output_dir=temp_export_dir)
+        records = [
+            {"title": f"Video {i}", "channel": "Channel A", "tags": [i]}
+            for i in range(4)
+        ]
+
+        df = formatter._to_dataframe(records)
+
+        assert df["channel"].dtype == "category"
+        assert df["title"].dtype != "category"
+        assert df["tags"].dtype != "category"
+
+    def test_export_excel_writes_dimension(
+        self, sample_data, temp_export_dir, monkeypatch
+    ):
+        """Test large-sheet Excel export records the sheet size for readers."""
+        monkeypatch.setattr("rabbitmirror.export_formatter._XLSX_DIRECT_WRITE_ROWS", 0)
+        formatter = ExportFormatter(output_dir=temp_export_dir)
+        output_path = formatter._export_excel(sample_data, "dimension_test")
+
+        # Read-only sheets report the stored <dimension> instead of scanning
+        workbook = load_workbook(output_path, read_only=True)
+        try:
+            assert workbook.worksheets[0].calculate_dimension() == "A1:C3"
+        finally:
+            workbook.close()
+        assert load_workbook(output_path).worksheets[0].dimensions == "A1:C3"
+
+    def test_export_excel_direct_writer_matches_openpyxl(
+        self, temp_export_dir, monkeypatch
+    ):
+        """Test large-sheet direct XML output reads back like openpyxl's."""
+        formatter = ExportFormatter(output_dir=temp_export_dir)
+        records = [
+            {
+                "title": f"Video <{i}> & more ",
+                "views": i,
+                "score": i / 3,
+                "watched": datetime(2024, 1, 1, 12, i),
+                "liked": i % 2 == 0,
+            }
+            for i in range(5)
+        ]
+        records.append({"title": "Partial", "missing": None})
+
+        reference = formatter._export_excel(records, "openpyxl_path")
+        monkeypatch.setattr("rabbitmirror.export_formatter._XLSX_DIRECT_WRITE_ROWS", 0)
+        direct = formatter._export_excel(records, "direct_path")
+
+        def cell_values(path):
+            workbook = load_workbook(path)
+            rows = workbook.worksheets[0].iter_rows()
+            return [[(c.value, c.number_format) for c in row] for row in rows]
+
+        assert cell_values(direct) == cell_values(reference)
+        assert pd.read_excel(direct).equals(pd.read_excel(reference))
+
+    def test_export_nested_records_are_flattened(self, temp_export_dir):
+        """Test records with nested dicts export as flattened columns."""
+        formatter = ExportFormatter(output_dir=temp_export_dir)
+        records = [
+            {"title": "Video 1", "stats": {"views": 10, "likes": 1}},
+            {"title": "Video 2", "stats": {"views": 20}},
+        ]
+
+        df = pd.read_csv(formatter._export_csv(records, "nested_records"))
+        assert df.columns.tolist() == ["title", "stats_views", "stats_likes"]
+        assert df["stats_views"].tolist() == [10, 20]
+
+        df_excel = pd.read_excel(formatter._export_excel(records, "nested_records"))
+        assert df_excel.columns.tolist() == df.columns.tolist()
+
+    def test_export_csv_records_with_reordered_keys(self, temp_export_dir):
+        """Test records sharing keys in a different order keep their values."""
+        formatter = ExportFormatter(output_dir=temp_export_dir)
+        records = [
+            {"title": "Video 1", "views": 1000},
+            {"views": 2000, "title": "Video 2"},
+        ]
+
+        df = pd.read_csv(formatter._export_csv(records, "reordered"))
+        assert df.columns.tolist() == ["title", "views"]
+        assert df["views"].tolist() == [1000, 2000]
+
+    @pytest.mark.parametrize("records", [[[1, 2], [3, 4]], [1, 2, 3], [[1, "a"], [2]]])
+    def test_export_excel_non_dict_records(self, records, temp_export_dir):
+        """Test lists and scalars export with positional columns like pandas."""
+        formatter = ExportFormatter(output_dir=temp_export_dir)
+
+        output_path = formatter.export_data(records, "excel", "positional")
+
+        expected = pd.DataFrame(records)
+        expected.to_excel(temp_export_dir / "expected.xlsx", index=False)
+        pd.testing.assert_frame_equal(
+            pd.read_excel(output_path),
+            pd.read_excel(temp_export_dir / "expected.xlsx"),
+        )
+
+    @pytest.mark.parametrize("row_count", [2, _XLSX_DIRECT_WRITE_ROWS + 2])
+    def test_export_excel_list_values(self, row_count, temp_export_dir):
+        """Test list-valued fields are written as their string form like pandas."""
+        formatter = ExportFormatter(output_dir=temp_export_dir)
+        records = [
+            {"title": "Video 1", "tags": ["python", "tutorial"]},
+            {"title": "Video 2", "tags": []},
+        ] * (row_count // 2)
+
+        output_path = formatter.export_data(records, "excel", "tags")
+
+        df = pd.read_excel(output_path)
+        assert df.columns.tolist() == ["title", "tags"]
+        assert df["tags"].tolist() == [str(record["tags"]) for record in records]
+
+    @pytest.mark.parametrize("records", [[[1, 2], [3, 4]], [1, 2, 3]])
+    def test_export_csv_non_dict_records(self, records, temp_export_dir):
+        """Test lists and scalars export to CSV with positional columns."""
+        formatter = ExportFormatter(output_dir=temp_export_dir)
+
+        output_path = formatter.export_data(records, "csv", "positional")
+
+        expected = pd.DataFrame(records).to_csv(index=False, lineterminator="\n")
+        assert Path(output_path).read_text(encoding="utf-8") == expected
@@ -1,7 +1,7 @@
 from pathlib import Path
 
 from rabbitmirror.exceptions import InvalidFormatError
-from rabbitmirror.parser import HistoryParser
+from rabbitmirror.parser import HistoryParser, _parse_timestamp
 
 # Sample test for HistoryParser
 
@@ -123,3 +123,105 @@ def test_parse_empty_html(tmp_path):
     parser = HistoryParser(str(test_file))
     entries = parser.parse()
     assert len(entries) == 0, "Should return empty list for empty HTML"
+
+
+def test_convert_timestamp_repeated_values_are_cached():
+    """Test that repeated timestamp strings are served from the parse cache."""
+    parser = HistoryParser("dummy_path")
+    _parse_timestamp.cache_clear()
+
+    first = parser._convert_timestamp("Jan 2, 2024, 9:05:00 AM PST")
+    second = parser._convert_timestamp("Jan 2, 2024, 9:05:00 AM PST")
+
+    assert first == second == "2024-01-02T09:05:00"
+    assert _parse_timestamp.cache_info().hits == 1
+
+
+def test_convert_timestamp_midnight_and_noon():
+    """Test 12 AM/PM handling in the YouTube timestamp fast path."""
+    parser = HistoryParser("dummy_path")
+    assert parser._convert_timestamp("Jan 1, 2024, 12:00:00 AM UTC") == (
+        "2024-01-01T00:00:00"
+    )
+    assert parser._convert_timestamp("Jan 1, 2024 12:15:00 PM") == (
+        "2024-01-01T12:15:00"
+    )
+
+
+def test_iter_entries_streams_same_entries_as_parse(tmp_path):
+    """Test that iter_entries yields the entries parse() returns, in order."""
+    cells = "".join(
+        f'<div class="outer-cell"><div class="content-cell">Watched '
+        f'<a href="https://www.youtube.com/watch?v={i}">Video {i}</a>'
+        f'<div class="mdl-typography--caption">Dec {i + 1}, 2023, 2:30:45 PM PST'
+        f"</div></div></div>"
+        for i in range(3)
+    )
+    test_file = tmp_path / "stream.html"
+    test_file.write_text(f"<html><body>{cells}</body></html>")
+
+    parser = HistoryParser(str(test_file))
+    streamed = parser.iter_entries()
+
+    assert not isinstance(streamed, list)
+    entries = list(streamed)
+    assert entries == parser.parse()
+    assert [e["title"] for e in entries] == ["Video 0", "Video 1", "Video 2"]
+    assert entries[2]["timestamp"] == "2023-12-03T14:30:45"
+
+
+def test_parse_reuses_cached_result_until_file_changes(tmp_path, monkeypatch):
+    """Test that parse() caches per file and re-parses once it is modified."""
+    HistoryParser.clear_cache()
+    test_file = tmp_path / "cached.html"
+    test_file.write_text(
+        '<div class="content-cell"><a href="https://example.com/1">One</a></div>'
+    )
+    parser = HistoryParser(str(test_file))
+
+    calls = []
+    original = HistoryParser._parse_with_fallback
+
+    def counting_parse(self):
+        calls.append(self.file_path)
+        return original(self)
+
+    monkeypatch.setattr(HistoryParser, "_parse_with_fallback", counting_parse)
+
+    first = parser.parse()
+    first[0]["title"] = "mutated"
+    assert parser.parse()[0]["title"] == "One"
+    assert HistoryParser(str(test_file)).parse()[0]["title"] == "One"
+    assert len(calls) == 1
+
+    test_file.write_text(
+        '<div class="content-cell"><a href="https://example.com/2">Second</a></div>'
+    )
+    assert parser.parse()[0]["title"] == "Second"
+    assert len(calls) == 2
+
+    HistoryParser.clear_cache()
+    parser.parse()
+    assert len(calls) == 3
+
+
+def test_parse_cache_keeps_only_recent_files(tmp_path, monkeypatch):
+    """Test that the parse cache is bounded and evicts the least recent file."""
+    monkeypatch.setattr("rabbitmirror.parser._PARSE_CACHE_FILES", 2)
+    HistoryParser.clear_cache()
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"history_{i}.html"
+        path.write_text(
+            f'<div class="content-cell"><a href="https://example.com/{i}">'
+            f"Video {i}</a></div>"
+        )
+        paths.append(str(path))
+
+    HistoryParser(paths[0]).parse()
+    HistoryParser(paths[1]).parse()
+    HistoryParser(paths[0]).parse()  # Most recently used again
+    HistoryParser(paths[2]).parse()
+
+    assert list(HistoryParser._parse_cache) == [paths[0], paths[2]]
+    HistoryParser.clear_cache()
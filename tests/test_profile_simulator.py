@@ -3,7 +3,7 @@ from datetime import datetime, timedelta
 import numpy as np
 import pytest
 
-from rabbitmirror.profile_simulator import ProfileSimulator
+from rabbitmirror.profile_simulator import ProfileSimulator, _AliasSampler
 
 
 @pytest.fixture
@@ -48,15 +48,14 @@ class TestProfileSimulator:
         assert simulator.time_bins == 24
         assert simulator.interval_bins == 50
         assert simulator.rng is not None
-        assert simulator.scaler is not None
 
     def test_initialization_with_seed(self):
         """Test ProfileSimulator initialization with custom seed."""
         seed = 42
         simulator = ProfileSimulator(seed=seed)
         assert (
-            simulator.rng.get_state()[1][0]
-            == np.random.RandomState(seed).get_state()[1][0]
+            simulator.rng.bit_generator.state["state"]["state"]
+            == np.random.default_rng(seed).bit_generator.state["state"]["state"]
         )
 
     def test_simulate_profile_basic(self, sample_profile):
@@ -115,6 +114,28 @@ class TestProfileSimulator:
         assert isinstance(patterns["daily_counts"], tuple)
         assert len(patterns["daily_counts"]) == 2  # mean, std
 
+    def test_viewing_patterns_cached_until_profile_changes(
+        self, sample_profile, monkeypatch
+    ):
+        """Test repeated simulations reuse patterns for an unchanged profile."""
+        simulator = ProfileSimulator(seed=42)
+        calls = []
+        original = simulator._extract_viewing_patterns
+
+        def counting_extract(profile):
+            calls.append(len(profile))
+            return original(profile)
+
+        monkeypatch.setattr(simulator, "_extract_viewing_patterns", counting_extract)
+
+        simulator.simulate_profile(sample_profile, duration_days=2)
+        simulator.simulate_profile(list(sample_profile), duration_days=2)
+        assert len(calls) == 1
+
+        sample_profile[0]["title"] = "Lofi Music Mix"
+        simulator.simulate_profile(sample_profile, duration_days=2)
+        assert len(calls) == 2
+
     def test_generate_timeline(self):
         """Test timeline generation."""
         simulator = ProfileSimulator()
@@ -138,6 +159,30 @@ class TestProfileSimulator:
         assert np.isclose(time_dist.sum(), 1.0)
         assert all(prob >= 0 for prob in time_dist)
 
+    def test_analyze_time_distribution_coarse_bins(self, sample_profile):
+        """Test hour counts fold into fewer bins like an equal-width histogram."""
+        simulator = ProfileSimulator()
+        simulator.time_bins = 6
+        time_dist = simulator._analyze_time_distribution(sample_profile)
+
+        hours = [datetime.fromisoformat(e["timestamp"]).hour for e in sample_profile]
+        expected, _ = np.histogram(hours, bins=6, range=(0, 24))
+        assert np.allclose(time_dist, expected / expected.sum())
+
+    def test_parse_timestamps_keeps_wall_clock_for_offsets(self):
+        """Test timestamps with UTC offsets keep their local hour and date."""
+        profile = [
+            {"timestamp": "2023-12-01T23:30:00+02:00"},
+            {"timestamp": "2023-12-02T00:15:00"},
+        ]
+        times = ProfileSimulator._parse_timestamps(profile)
+
+        assert times.dtype == np.dtype("datetime64[us]")
+        assert times.astype(str).tolist() == [
+            "2023-12-01T23:30:00.000000",
+            "2023-12-02T00:15:00.000000",
+        ]
+
     def test_analyze_content_distribution(self, sample_profile):
         """Test content distribution analysis."""
         simulator = ProfileSimulator()
@@ -258,6 +303,25 @@ class TestProfileSimulator:
         for i, expected_prob in enumerate(dist / dist.sum()):
             assert abs(sample_probs[i] - expected_prob) < 0.1
 
+    def test_sample_from_distribution_batch(self):
+        """Test drawing many indices from a distribution in one call."""
+        simulator = ProfileSimulator(seed=42)
+        dist = np.array([1.0, 3.0, 4.0, 2.0])
+
+        samples = simulator._sample_from_distribution_batch(dist, 5000)
+
+        assert samples.shape == (5000,)
+        sample_probs = np.bincount(samples, minlength=len(dist)) / len(samples)
+        assert np.allclose(sample_probs, dist / dist.sum(), atol=0.05)
+
+    def test_sample_daily_counts(self):
+        """Test per-day counts are drawn together and never drop below 1."""
+        simulator = ProfileSimulator(seed=42)
+        counts = simulator._sample_daily_counts((2.0, 5.0), 200)
+
+        assert counts.shape == (200,)
+        assert counts.min() >= 1
+
     def test_sample_from_dict(self):
         """Test sampling from dictionary distribution."""
         simulator = ProfileSimulator(seed=42)
@@ -277,6 +341,19 @@ class TestProfileSimulator:
             actual_prob = sample_counts[key] / len(samples)
             assert abs(actual_prob - expected_prob) < 0.1
 
+    def test_alias_sampler_matches_weights(self):
+        """Test alias-table draws follow item frequencies."""
+        sampler = _AliasSampler.from_items(["a"] * 6 + ["b"] * 3 + ["c"])
+        rng = np.random.default_rng(42)
+
+        samples = sampler.draw_many(rng, 20000) + [
+            sampler.draw(rng) for _ in range(2000)
+        ]
+
+        assert set(samples) == {"a", "b", "c"}
+        for key, expected_prob in {"a": 0.6, "b": 0.3, "c": 0.1}.items():
+            assert abs(samples.count(key) / len(samples) - expected_prob) < 0.02
+
     def test_generate_title(self):
         """Test title generation."""
         simulator = ProfileSimulator(seed=42)
@@ -325,6 +402,14 @@ class TestProfileSimulator:
             entry_time = datetime.fromisoformat(entry["timestamp"])
             assert entry_time.date() == start_time.date()
 
+    def test_entry_offsets_carry_past_midnight(self):
+        """Test an interval ending after midnight moves later entries a day on."""
+        offsets = ProfileSimulator._entry_offsets(
+            np.array([23, 1, 2]), np.array([50, 0, 30]), np.array([20, 5, 5])
+        )
+
+        assert offsets.tolist() == [23 * 60 + 50, 24 * 60 + 60, 24 * 60 + 150]
+
     def test_reproducibility_with_seed(self, sample_profile):
         """Test that results are reproducible with the same seed."""
         seed = 42
@@ -1,8 +1,9 @@
+import hashlib
 from pathlib import Path
 
 import pytest
 
-from rabbitmirror.qr_generator import QRGenerator
+from rabbitmirror.qr_generator import QRGenerator, _render_png_bytes
 
 
 @pytest.fixture
@@ -54,11 +55,9 @@ class TestQRGenerator:
         output_path = qr_gen.generate_qr(data)
 
         assert Path(output_path).exists()
-        # Should contain hash of the data
-        expected_hash = str(hash(data))
-        assert (
-            expected_hash in Path(output_path).stem or "qr_" in Path(output_path).stem
-        )
+        # Should contain a stable digest of the data
+        expected_hash = hashlib.blake2b(data.encode("utf-8"), digest_size=8)
+        assert Path(output_path).stem == f"qr_{expected_hash.hexdigest()}"
 
     def test_generate_qr_different_data(self, temp_qr_dir):
         """Test QR code generation with different types of data."""
@@ -139,6 +138,69 @@ class TestQRGenerator:
         # Same data should produce same filename (will overwrite)
         assert Path(path1).name == Path(path2).name
 
+    def test_repeated_data_reuses_rendered_png(self, temp_qr_dir):
+        """Test that repeated codes are rendered once and written identically."""
+        _render_png_bytes.cache_clear()
+        qr_gen = QRGenerator(output_dir=temp_qr_dir)
+
+        path1 = qr_gen.generate_qr("Cached data", "first.png")
+        path2 = qr_gen.generate_qr("Cached data", "second.png")
+
+        assert Path(path1).read_bytes() == Path(path2).read_bytes()
+        assert Path(path1).read_bytes().startswith(b"\x89PNG")
+        assert _render_png_bytes.cache_info().hits == 1
+
+        QRGenerator(output_dir=temp_qr_dir, color="red").generate_qr("Cached data")
+        assert _render_png_bytes.cache_info().misses == 2
+
+    def test_generate_qr_batch_matches_sequential(self, temp_qr_dir):
+        """Test that batch generation writes the same files, in item order."""
+        qr_gen = QRGenerator(output_dir=temp_qr_dir, error_correction="H")
+        items = [(f"Batch data {i}", f"batch_{i}.png") for i in range(4)]
+        items.append(("Batch data auto", None))
+
+        paths = qr_gen.generate_qr_batch(items)
+
+        assert [Path(p).name for p in paths[:4]] == [name for _, name in items[:4]]
+        for (data, _), path in zip(items, paths):
+            expected = Path(qr_gen.generate_qr(data, "sequential.png")).read_bytes()
+            assert Path(path).read_bytes() == expected
+        assert qr_gen.generate_qr_batch([]) == []
+
+    def test_generate_qr_batch_pool_only_for_large_batches(
+        self, temp_qr_dir, monkeypatch
+    ):
+        """Test small batches stay in-process and pools are capped at the batch."""
+        pools = []
+
+        class RecordingPool:
+            def __init__(self, max_workers):
+                pools.append(max_workers)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                return False
+
+            def map(self, fn, *iterables, chunksize=1):
+                return map(fn, *iterables)
+
+        monkeypatch.setattr(
+            "rabbitmirror.qr_generator.ProcessPoolExecutor", RecordingPool
+        )
+        monkeypatch.setattr("rabbitmirror.qr_generator.os.cpu_count", lambda: 8)
+        qr_gen = QRGenerator(output_dir=temp_qr_dir)
+        items = [(f"Pool data {i}", f"pool_{i}.png") for i in range(3)]
+
+        qr_gen.generate_qr_batch(items)
+        assert pools == []
+
+        monkeypatch.setattr("rabbitmirror.qr_generator._PARALLEL_MIN_ITEMS", 2)
+        paths = qr_gen.generate_qr_batch(items)
+        assert pools == [3]
+        assert [Path(p).name for p in paths] == [name for _, name in items]
+
     def test_unicode_data(self, temp_qr_dir):
         """Test QR code generation with Unicode data."""
         qr_gen = QRGenerator(output_dir=temp_qr_dir)
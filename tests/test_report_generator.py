@@ -62,6 +62,17 @@ class TestReportGenerator:
         report_gen = ReportGenerator(template_dir=str(temp_template_dir))
         assert report_gen.env is not None
 
+    def test_generators_share_environment(self, temp_template_dir, tmp_path):
+        """Test generators for one directory reuse compiled templates."""
+        first = ReportGenerator(template_dir=str(temp_template_dir))
+        second = ReportGenerator(template_dir=temp_template_dir)
+
+        assert first.env is second.env
+        assert first.env.get_template("test_template.html") is (
+            second.env.get_template("test_template.html")
+        )
+        assert ReportGenerator(template_dir=str(tmp_path)).env is not first.env
+
     def test_generate_report_basic(
         self, temp_template_dir, sample_report_data, tmp_path
     ):
@@ -294,3 +305,64 @@ class TestReportGenerator:
         assert "émojis" in content
         assert "中文测试" in content
         assert "テスト" in content
+
+    def test_auto_reload_disabled_serves_cached_template(
+        self, temp_template_dir, tmp_path
+    ):
+        """Test that auto_reload=False skips re-reading edited templates."""
+        template_file = temp_template_dir / "reload_template.html"
+        template_file.write_text("first {{ value }}")
+        output_file = tmp_path / "reload.html"
+
+        static_gen = ReportGenerator(str(temp_template_dir), auto_reload=False)
+        reloading_gen = ReportGenerator(str(temp_template_dir))
+        assert static_gen.env is not reloading_gen.env
+
+        static_gen.generate_report({"value": 1}, "reload_template.html", output_file)
+        template_file.write_text("second {{ value }}")
+
+        static_gen.generate_report({"value": 2}, "reload_template.html", output_file)
+        assert output_file.read_text() == "first 2"
+        reloading_gen.generate_report({"value": 3}, "reload_template.html", output_file)
+        assert output_file.read_text() == "second 3"
+
+    def test_large_report_streams_to_file(self, temp_template_dir, tmp_path):
+        """Test large reports are streamed and match a full render."""
+        template_file = temp_template_dir / "rows_template.html"
+        template_file.write_text(
+            "<ul>{% for row in rows %}<li>{{ row }}</li>{% endfor %}</ul>"
+        )
+        rows = [f"Video <{i}> ✓" for i in range(5000)]
+
+        report_gen = ReportGenerator(template_dir=str(temp_template_dir))
+        output_file = tmp_path / "nested" / "rows.html"
+        report_gen.generate_report({"rows": rows}, "rows_template.html", output_file)
+
+        expected = report_gen.env.get_template("rows_template.html").render(rows=rows)
+        assert output_file.read_text(encoding="utf-8") == expected
+        assert "<li>Video &lt;4999&gt; ✓</li>" in expected
+
+    def test_template_error_leaves_no_partial_report(self, temp_template_dir, tmp_path):
+        """Test a render error part way through keeps the previous report."""
+        template_file = temp_template_dir / "failing_template.html"
+        template_file.write_text(
+            "{% for row in rows %}<p>{{ row }}</p>{% endfor %}{{ fail() }}"
+        )
+
+        def fail():
+            raise RuntimeError("template failed")
+
+        output_file = tmp_path / "reports" / "failing.html"
+        output_file.parent.mkdir()
+        output_file.write_text("previous report")
+
+        report_gen = ReportGenerator(template_dir=str(temp_template_dir))
+        with pytest.raises(RuntimeError, match="template failed"):
+            report_gen.generate_report(
+                {"rows": range(5000), "fail": fail},
+                "failing_template.html",
+                output_file,
+            )
+
+        assert output_file.read_text() == "previous report"
+        assert list(output_file.parent.iterdir()) == [output_file]
@@ -1,7 +1,13 @@
 import jsonschema
 import pytest
 
-from rabbitmirror.schema_validator import SchemaValidator
+from rabbitmirror.schema_validator import SchemaValidator, _is_json_native
+
+
+@pytest.fixture(scope="module")
+def validator():
+    """Schema validator shared by the tests in this module."""
+    return SchemaValidator()
 
 
 class TestSchemaValidator:
@@ -16,9 +22,8 @@ class TestSchemaValidator:
         assert isinstance(validator.schemas, dict)
         assert len(validator.schemas) > 0
 
-    def test_available_schemas(self):
+    def test_available_schemas(self, validator):
         """Test that all expected schemas are available."""
-        validator = SchemaValidator()
         available_schemas = validator.get_available_schemas()
 
         expected_schemas = [
@@ -32,33 +37,75 @@ class TestSchemaValidator:
         for schema in expected_schemas:
             assert schema in available_schemas
 
-    def test_valid_watch_history_data(self):
-        """Test validation of valid watch history data."""
-        validator = SchemaValidator()
-
-        valid_data = {
-            "entries": [
+    @pytest.mark.parametrize(
+        "schema_type,payload",
+        [
+            (
+                "watch_history",
                 {
-                    "timestamp": "2025-07-10T12:00:00",
-                    "title": "Python Tutorial",
-                    "category": "Education",
+                    "entries": [
+                        {
+                            "timestamp": "2025-07-10T12:00:00",
+                            "title": "Python Tutorial",
+                            "category": "Education",
+                        },
+                        {
+                            "timestamp": "2025-07-10T13:00:00",
+                            "title": "React Basics",
+                            "category": "Programming",
+                        },
+                    ]
                 },
+            ),
+            (
+                "suppression_analysis",
                 {
-                    "timestamp": "2025-07-10T13:00:00",
-                    "title": "React Basics",
-                    "category": "Programming",
+                    "suppression_results": {
+                        "suppression_scores": [0.1, 0.5, 0.9],
+                        "baseline_period_days": 30,
+                    }
                 },
-            ]
-        }
-
-        # Should not raise an exception
-        result = validator.validate(valid_data, "watch_history")
-        assert result is True
-
-    def test_invalid_watch_history_data(self):
+            ),
+            (
+                "pattern_analysis",
+                {
+                    "patterns": {
+                        "pattern_scores": [0.2, 0.7, 0.9],
+                        "detected_patterns": [
+                            {
+                                "pattern_type": "repetitive_viewing",
+                                "confidence": 0.85,
+                                "description": "User shows repetitive viewing "
+                                "patterns",
+                            }
+                        ],
+                    }
+                },
+            ),
+            (
+                "simulation_results",
+                {
+                    "simulated_entries": [
+                        {
+                            "timestamp": "2025-07-10T12:00:00",
+                            "title": "Simulated Video",
+                            "confidence": 0.9,
+                        }
+                    ],
+                    "simulation_parameters": {
+                        "duration_days": 7,
+                        "profile_type": "regular",
+                    },
+                },
+            ),
+        ],
+    )
+    def test_valid_payloads(self, validator, schema_type, payload):
+        """Test validation of valid data for each schema type."""
+        assert validator.validate(payload, schema_type) is True
+
+    def test_invalid_watch_history_data(self, validator):
         """Test validation of invalid watch history data."""
-        validator = SchemaValidator()
-
         invalid_data = {
             "entries": [
                 {
@@ -72,10 +119,8 @@ class TestSchemaValidator:
         with pytest.raises(jsonschema.exceptions.ValidationError):
             validator.validate(invalid_data, "watch_history")
 
-    def test_validate_with_details_success(self):
+    def test_validate_with_details_success(self, validator):
         """Test detailed validation with valid data."""
-        validator = SchemaValidator()
-
         valid_data = {
             "clusters": {
                 "cluster_labels": [0, 1, 0, 1],
@@ -89,10 +134,8 @@ class TestSchemaValidator:
         assert result["schema_type"] == "cluster_analysis"
         assert "message" in result
 
-    def test_validate_with_details_failure(self):
+    def test_validate_with_details_failure(self, validator):
         """Test detailed validation with invalid data."""
-        validator = SchemaValidator()
-
         invalid_data = {
             "clusters": {"cluster_labels": "invalid_format"}  # Should be array
         }
@@ -103,19 +146,15 @@ class TestSchemaValidator:
         assert "error" in result
         assert result["schema_type"] == "cluster_analysis"
 
-    def test_nonexistent_schema(self):
+    def test_nonexistent_schema(self, validator):
         """Test validation against non-existent schema."""
-        validator = SchemaValidator()
-
         data = {"test": "data"}
 
         with pytest.raises(ValueError, match="Schema not found for type"):
             validator.validate(data, "nonexistent_schema")
 
-    def test_auto_detect_schema_success(self):
+    def test_auto_detect_schema_success(self, validator):
         """Test automatic schema detection with valid data."""
-        validator = SchemaValidator()
-
         watch_history_data = {
             "entries": [{"timestamp": "2025-07-10T12:00:00", "title": "Test Video"}]
         }
@@ -123,19 +162,15 @@ class TestSchemaValidator:
         detected_schema = validator.auto_detect_schema(watch_history_data)
         assert detected_schema == "watch_history"
 
-    def test_auto_detect_schema_failure(self):
+    def test_auto_detect_schema_failure(self, validator):
         """Test automatic schema detection with invalid data."""
-        validator = SchemaValidator()
-
         invalid_data = {"random_field": "random_value", "another_field": 123}
 
         detected_schema = validator.auto_detect_schema(invalid_data)
         assert detected_schema is None
 
-    def test_structure_similarity_calculation(self):
+    def test_structure_similarity_calculation(self, validator):
         """Test structure similarity calculation."""
-        validator = SchemaValidator()
-
         # Data that partially matches watch_history schema
         partial_data = {"entries": "wrong_type"}  # Should be array
 
@@ -145,10 +180,8 @@ class TestSchemaValidator:
         assert isinstance(similarity, int)
         assert 0 <= similarity <= 100
 
-    def test_type_matching(self):
+    def test_type_matching(self, validator):
         """Test the type matching utility method."""
-        validator = SchemaValidator()
-
         # Test various type matches
         assert validator._matches_type("test", "string") is True
         assert validator._matches_type(123, "integer") is True
@@ -162,11 +195,11 @@ class TestSchemaValidator:
         assert validator._matches_type(123, "string") is False
         assert validator._matches_type("test", "integer") is False
         assert validator._matches_type([1, 2, 3], "object") is False
+        assert validator._matches_type(None, "unknown") is False
+        assert validator._matches_type("test", ["string", "null"]) is False
 
-    def test_get_schema(self):
+    def test_get_schema(self, validator):
         """Test getting specific schema by type."""
-        validator = SchemaValidator()
-
         # Test getting existing schema
         schema = validator.get_schema("watch_history")
         assert schema is not None
@@ -177,62 +210,8 @@ class TestSchemaValidator:
         schema = validator.get_schema("nonexistent")
         assert schema is None
 
-    def test_suppression_analysis_schema(self):
-        """Test suppression analysis specific schema validation."""
-        validator = SchemaValidator()
-
-        valid_suppression_data = {
-            "suppression_results": {
-                "suppression_scores": [0.1, 0.5, 0.9],
-                "baseline_period_days": 30,
-            }
-        }
-
-        result = validator.validate(valid_suppression_data, "suppression_analysis")
-        assert result is True
-
-    def test_pattern_analysis_schema(self):
-        """Test pattern analysis specific schema validation."""
-        validator = SchemaValidator()
-
-        valid_pattern_data = {
-            "patterns": {
-                "pattern_scores": [0.2, 0.7, 0.9],
-                "detected_patterns": [
-                    {
-                        "pattern_type": "repetitive_viewing",
-                        "confidence": 0.85,
-                        "description": "User shows repetitive viewing patterns",
-                    }
-                ],
-            }
-        }
-
-        result = validator.validate(valid_pattern_data, "pattern_analysis")
-        assert result is True
-
-    def test_simulation_results_schema(self):
-        """Test simulation results specific schema validation."""
-        validator = SchemaValidator()
-
-        valid_simulation_data = {
-            "simulated_entries": [
-                {
-                    "timestamp": "2025-07-10T12:00:00",
-                    "title": "Simulated Video",
-                    "confidence": 0.9,
-                }
-            ],
-            "simulation_parameters": {"duration_days": 7, "profile_type": "regular"},
-        }
-
-        result = validator.validate(valid_simulation_data, "simulation_results")
-        assert result is True
-
-    def test_edge_cases(self):
+    def test_edge_cases(self, validator):
         """Test edge cases and boundary conditions."""
-        validator = SchemaValidator()
-
         # Test with empty data
         empty_data = {}
 
@@ -254,3 +233,213 @@ class TestSchemaValidator:
         detected = validator.auto_detect_schema(multi_match_data)
         # Should detect one of the matching schemas
         assert detected in ["watch_history", "cluster_analysis", "pattern_analysis"]
+
+    def test_compiled_validators_report_same_errors(self, validator):
+        """Test compiled validators pick the error jsonschema.validate raises."""
+        invalid_data = {
+            "entries": [{"timestamp": 1, "title": ""}, {"category": "Music"}],
+            "metadata": {"total_entries": -1},
+        }
+        schema = validator.get_schema("watch_history")
+
+        with pytest.raises(jsonschema.exceptions.ValidationError) as expected:
+            jsonschema.validate(instance=invalid_data, schema=schema)
+        with pytest.raises(jsonschema.exceptions.ValidationError) as raised:
+            validator.validate(invalid_data, "watch_history")
+        details = validator.validate_with_details(invalid_data, "watch_history")
+
+        assert raised.value.message == expected.value.message
+        assert details["error"] == expected.value.message
+        assert details["path"] == list(expected.value.absolute_path)
+
+    def test_multi_error_value_reports_first_keyword_error(self, validator):
+        """Test a value failing several keywords reports jsonschema's pick."""
+        invalid_data = {"entries": [], "metadata": {"total_entries": -0.5}}
+
+        with pytest.raises(jsonschema.exceptions.ValidationError) as expected:
+            jsonschema.validate(
+                instance=invalid_data, schema=validator.get_schema("watch_history")
+            )
+        details = validator.validate_with_details(invalid_data, "watch_history")
+
+        assert expected.value.message == "-0.5 is not of type 'integer'"
+        assert details["error"] == expected.value.message
+        assert details["path"] == ["metadata", "total_entries"]
+
+    def test_auto_detect_only_validates_schemas_with_required_keys(
+        self, validator, monkeypatch
+    ):
+        """Test auto-detection skips full validation for missing required keys."""
+        validated = []
+        original = validator.validate
+
+        def recording_validate(data, schema_type):
+            validated.append(schema_type)
+            return original(data, schema_type)
+
+        monkeypatch.setattr(validator, "validate", recording_validate)
+
+        detected = validator.auto_detect_schema({"clusters": {"cluster_labels": []}})
+
+        assert detected == "cluster_analysis"
+        assert validated == ["cluster_analysis"]
+
+    @pytest.mark.parametrize("data", [[{"title": "a"}], 42, None])
+    def test_auto_detect_non_object_data(self, validator, data):
+        """Test top-level lists (Takeout layout) and scalars detect no schema."""
+        assert validator.auto_detect_schema(data) is None
+
+    def test_result_cache_reuses_results_for_equal_data(self, monkeypatch):
+        """Test opt-in result caching is keyed on content, not identity."""
+        validator = SchemaValidator(cache_results=True)
+        calls = []
+        original = validator._first_error
+
+        def counting_first_error(data, schema_type):
+            calls.append(schema_type)
+            return original(data, schema_type)
+
+        monkeypatch.setattr(validator, "_first_error", counting_first_error)
+
+        data = {"entries": [{"timestamp": "2025-07-10T12:00:00", "title": "A"}]}
+        first = validator.validate_with_details(data, "watch_history")
+        second = validator.validate_with_details(
+            {"entries": [{"title": "A", "timestamp": "2025-07-10T12:00:00"}]},
+            "watch_history",
+        )
+        assert first == second and first["valid"] is True
+        assert len(calls) == 1
+
+        data["entries"][0]["title"] = ""
+        assert validator.validate_with_details(data, "watch_history")["valid"] is False
+        assert len(calls) == 2
+
+        uncached = SchemaValidator()
+        assert uncached.validate_with_details(data, "watch_history")["valid"] is False
+        assert uncached._result_cache == {}
+
+    def test_result_cache_returns_independent_copies(self):
+        """Test callers mutating a cached result do not affect later hits."""
+        validator = SchemaValidator(cache_results=True)
+        data = {"entries": [{"timestamp": "2025-07-10T12:00:00", "title": ""}]}
+
+        first = validator.validate_with_details(data, "watch_history")
+        first["path"].append("tampered")
+        first["failed_value"] = None
+        second = validator.validate_with_details(data, "watch_history")
+
+        assert second["path"] == ["entries", 0, "title"]
+        assert second["failed_value"] == ""
+
+    def test_result_cache_skips_non_json_data(self):
+        """Test tuples and non-str keys are not cached under their JSON form."""
+        validator = SchemaValidator(cache_results=True)
+        entry = {"timestamp": "2025-07-10T12:00:00", "title": "A"}
+
+        assert validator.validate_with_details({"entries": [entry]}, "watch_history")[
+            "valid"
+        ]
+        tuple_result = validator.validate_with_details(
+            {"entries": (entry,)}, "watch_history"
+        )
+        assert tuple_result["valid"] is False
+        assert validator._result_key({1: "a"}, "watch_history") is None
+        assert len(validator._result_cache) == 1
+
+    def test_validation_without_fastjsonschema(self, monkeypatch):
+        """Test jsonschema alone gives the same results when the fast path is off."""
+        monkeypatch.setattr("rabbitmirror.schema_validator.fastjsonschema", None)
+        validator = SchemaValidator()
+
+        valid_data = {"entries": [{"timestamp": "2025-07-10", "title": "A"}]}
+        invalid_data = {"entries": [{"timestamp": "2025-07-10", "title": ""}]}
+
+        assert validator.validate(valid_data, "watch_history") is True
+        details = validator.validate_with_details(invalid_data, "watch_history")
+        assert details["valid"] is False
+        assert details["path"] == ["entries", 0, "title"]
+        assert validator._fast_validators == {"watch_history": None}
+
+    def test_tuples_are_rejected_like_jsonschema(self, validator):
+        """Test non-JSON containers skip fastjsonschema, which accepts tuples."""
+        entry = {"timestamp": "2025-07-10T12:00:00", "title": "A"}
+        data = {"entries": (entry,)}
+
+        with pytest.raises(jsonschema.exceptions.ValidationError):
+            jsonschema.validate(data, validator.get_schema("watch_history"))
+        with pytest.raises(jsonschema.exceptions.ValidationError):
+            validator.validate(data, "watch_history")
+        assert validator.validate({"entries": [entry]}, "watch_history") is True
+
+    @pytest.mark.parametrize(
+        "data,expected",
+        [
+            ({"a": [1, 2.0, None, True, "x", {"b": []}]}, True),
+            ({"a": [[{"b": (1,)}]]}, False),
+            ({1: "a"}, False),
+            ({"a": {1, 2}}, False),
+            ("text", True),
+        ],
+    )
+    def test_json_native_check(self, data, expected):
+        """Test only parsed-JSON shapes qualify for the fast path."""
+        assert _is_json_native(data) is expected
+
+    def test_structure_similarity_scores(self, validator):
+        """Test similarity weights required keys and top-level property types."""
+        score = validator._calculate_structure_similarity
+
+        assert score({"entries": "wrong_type"}, "watch_history") == 62
+        assert score({"entries": [], "metadata": 1}, "watch_history") == 87
+        assert score({"entries": [], "metadata": {}}, "watch_history") == 100
+        assert score({"unrelated": []}, "watch_history") == 0
+        assert score({"entries": []}, "nonexistent_schema") == 0
+
+    @pytest.mark.parametrize("data", [[], "abc", "entries"])
+    def test_non_object_data_scores_zero(self, validator, data):
+        """Test non-dict data has no structural similarity and is not detected."""
+        assert validator._calculate_structure_similarity(data, "watch_history") == 0
+        assert validator.auto_detect_schema(data) is None
+
+    def test_schemas_are_compiled_on_first_use(self):
+        """Test that only the schemas that are used get compiled."""
+        validator = SchemaValidator()
+        assert validator._validators == {} and validator._fast_validators == {}
+
+        validator.validate({"clusters": {"cluster_labels": [0]}}, "cluster_analysis")
+        validator.validate_with_details({"clusters": []}, "cluster_analysis")
+
+        assert set(validator._fast_validators) == {"cluster_analysis"}
+        assert set(validator._validators) == {"cluster_analysis"}
+
+    def test_auto_detect_stops_at_first_perfect_match(self, validator, monkeypatch):
+        """Test auto-detection does not score schemas after a perfect match."""
+        scored = []
+        original = validator._calculate_structure_similarity
+
+        def recording_similarity(data, schema_type):
+            scored.append(schema_type)
+            return original(data, schema_type)
+
+        monkeypatch.setattr(
+            validator, "_calculate_structure_similarity", recording_similarity
+        )
+
+        assert validator.auto_detect_schema({"entries": []}) == "watch_history"
+        assert scored == []
+
+        multi_match = {"clusters": "bad", "patterns": {"pattern_scores": []}}
+        assert validator.auto_detect_schema(multi_match) == "pattern_analysis"
+        assert scored == ["watch_history", "cluster_analysis", "suppression_analysis"]
+
+    def test_compiled_validators_are_shared_between_instances(self):
+        """Test a schema is compiled once per process, not once per instance."""
+        first, second = SchemaValidator(), SchemaValidator()
+        data = {"entries": [{"timestamp": "2025-07-10", "title": ""}]}
+        first.validate_with_details(data, "watch_history")
+        second.validate_with_details(data, "watch_history")
+
+        assert first._validators["watch_history"] is second._validators["watch_history"]
+        assert first._fast_validator("watch_history") is second._fast_validator(
+            "watch_history"
+        )
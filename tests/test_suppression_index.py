@@ -5,7 +5,7 @@ import pytest
 from rabbitmirror.suppression_index import SuppressionIndex
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_entries():
     """Sample entries for suppression analysis."""
     base_time = datetime.now() - timedelta(days=60)
@@ -41,6 +41,24 @@ def sample_entries():
     )
 
 
+@pytest.fixture(scope="module")
+def si():
+    """Suppression index shared by the tests in this module."""
+    return SuppressionIndex(baseline_period_days=30)
+
+
+@pytest.fixture(scope="module")
+def baseline_metrics(si, sample_entries):
+    """Period metrics for the first half of the sample entries."""
+    return si._calculate_period_metrics(sample_entries[:30])
+
+
+@pytest.fixture(scope="module")
+def analysis_metrics(si, sample_entries):
+    """Period metrics for the second half of the sample entries."""
+    return si._calculate_period_metrics(sample_entries[30:])
+
+
 class TestSuppressionIndex:
     """Test suite for the SuppressionIndex class."""
 
@@ -49,9 +67,8 @@ class TestSuppressionIndex:
         si = SuppressionIndex(baseline_period_days=30)
         assert si.baseline_period_days == 30
 
-    def test_calculate_suppression(self, sample_entries):
+    def test_calculate_suppression(self, si, sample_entries):
         """Test basic suppression calculation."""
-        si = SuppressionIndex(baseline_period_days=30)
         results = si.calculate_suppression(sample_entries)
 
         assert "overall_suppression" in results
@@ -64,15 +81,13 @@ class TestSuppressionIndex:
         assert "news" in results["category_suppression"]
         assert "entertainment" in results["category_suppression"]
 
-    def test_find_split_point(self, sample_entries):
+    def test_find_split_point(self, si, sample_entries):
         """Test finding split point for baseline and analysis periods."""
-        si = SuppressionIndex(baseline_period_days=30)
         split_point = si._find_split_point(sample_entries)
         assert split_point == len(sample_entries) // 2
 
-    def test_calculate_period_metrics(self, sample_entries):
+    def test_calculate_period_metrics(self, si, sample_entries):
         """Test calculation of period metrics."""
-        si = SuppressionIndex(baseline_period_days=30)
         metrics = si._calculate_period_metrics(sample_entries)
 
         assert "total_views" in metrics
@@ -83,9 +98,8 @@ class TestSuppressionIndex:
         assert metrics["total_views"] == len(sample_entries)
         assert isinstance(metrics["view_velocity"], float)
 
-    def test_get_category_distribution(self, sample_entries):
+    def test_get_category_distribution(self, si, sample_entries):
         """Test category distribution calculation."""
-        si = SuppressionIndex(baseline_period_days=30)
         distribution = si._get_category_distribution(sample_entries)
 
         assert isinstance(distribution, dict)
@@ -99,20 +113,17 @@ class TestSuppressionIndex:
         assert "news" in distribution
         assert "entertainment" in distribution
 
-    def test_view_velocity_calculation(self, sample_entries):
+    def test_view_velocity_calculation(self, si, sample_entries):
         """Test view velocity calculation."""
-        si = SuppressionIndex(baseline_period_days=30)
         velocity = si._calculate_view_velocity(sample_entries)
 
         assert isinstance(velocity, float)
         assert velocity > 0
 
-    def test_overall_suppression_calculation(self, sample_entries):
+    def test_overall_suppression_calculation(
+        self, si, baseline_metrics, analysis_metrics
+    ):
         """Test overall suppression calculation logic."""
-        si = SuppressionIndex(baseline_period_days=30)
-        baseline_metrics = si._calculate_period_metrics(sample_entries[:30])
-        analysis_metrics = si._calculate_period_metrics(sample_entries[30:])
-
         suppression = si._calculate_overall_suppression(
             baseline_metrics, analysis_metrics
         )
@@ -120,12 +131,10 @@ class TestSuppressionIndex:
         assert isinstance(suppression, float)
         assert 0 <= suppression <= 1
 
-    def test_category_suppression_calculation(self, sample_entries):
+    def test_category_suppression_calculation(
+        self, si, baseline_metrics, analysis_metrics
+    ):
         """Test category-specific suppression calculation logic."""
-        si = SuppressionIndex(baseline_period_days=30)
-        baseline_metrics = si._calculate_period_metrics(sample_entries[:30])
-        analysis_metrics = si._calculate_period_metrics(sample_entries[30:])
-
         category_suppression = si._calculate_category_suppression(
             baseline_metrics, analysis_metrics
         )
@@ -134,19 +143,16 @@ class TestSuppressionIndex:
         for category, suppression in category_suppression.items():
             assert 0 <= suppression <= 1
 
-    def test_empty_entries(self):
+    def test_empty_entries(self, si):
         """Test suppression calculation with empty entries."""
-        si = SuppressionIndex(baseline_period_days=30)
         results = si.calculate_suppression([])
 
         assert "overall_suppression" in results
         assert "category_suppression" in results
         assert "temporal_patterns" in results
 
-    def test_zero_baseline_views(self):
+    def test_zero_baseline_views(self, si):
         """Test suppression calculation when baseline has zero views."""
-        si = SuppressionIndex(baseline_period_days=30)
-
         baseline_metrics = {"total_views": 0, "category_distribution": {}}
         analysis_metrics = {"total_views": 10, "category_distribution": {"news": 1.0}}
 
@@ -1,47 +1,86 @@
+from datetime import date, datetime, time
 from unittest.mock import patch
 
+import pytest
+
 from rabbitmirror.symbolic_logger import SymbolicLogger
 
 
-def test_log_event():
-    logger = SymbolicLogger(log_dir="test_logs")
+@pytest.fixture(scope="module")
+def sym_logger(tmp_path_factory):
+    """Symbolic logger shared by the tests in this module."""
+    return SymbolicLogger(log_dir=tmp_path_factory.mktemp("logs"))
+
+
+def test_log_event(sym_logger):
     event_type = "test_event"
     data = {"key": "value"}
     with patch("loguru.logger.info") as mock_info:
-        logger.log_event(event_type, data)
-        mock_info.assert_called_once_with(f'{event_type}: {{"key": "value"}}')
+        sym_logger.log_event(event_type, data)
+        mock_info.assert_called_once_with(f'{event_type}: {{"key":"value"}}')
 
 
-def test_log_error():
-    logger = SymbolicLogger(log_dir="test_logs")
+def test_log_error(sym_logger):
     error_type = "test_error"
     error = Exception("something went wrong")
     context = {"context_key": "context_value"}
     with patch("loguru.logger.error") as mock_error:
-        logger.log_error(error_type, error, context)
+        sym_logger.log_error(error_type, error, context)
         # expected_call = {
         #     "error_type": error_type,
         #     "error_message": str(error),
         #     "context": context,
         # }
         mock_error.assert_called_once_with(
-            'Error: {"error_type": "test_error", "error_message": "something went '
-            'wrong", "context": {"context_key": "context_value"}}'
+            'Error: {"error_type":"test_error","error_message":"something went '
+            'wrong","context":{"context_key":"context_value"}}'
         )
 
 
-def test_log_error_without_context():
-    logger = SymbolicLogger(log_dir="test_logs")
+def test_log_error_without_context(sym_logger):
     error_type = "test_error_without_context"
     error = Exception("Error without context")
     with patch("loguru.logger.error") as mock_error:
-        logger.log_error(error_type, error)
+        sym_logger.log_error(error_type, error)
         # expected_call = {
         #     "error_type": error_type,
         #     "error_message": str(error),
         #     "context": {},
         # }
         mock_error.assert_called_once_with(
-            'Error: {"error_type": "test_error_without_context", "error_message": '
-            '"Error without context", "context": {}}'
+            'Error: {"error_type":"test_error_without_context","error_message":'
+            '"Error without context","context":{}}'
+        )
+
+
+def test_log_event_stdlib_fallback_matches_orjson(sym_logger):
+    data = {"title": "Café 🐰", "count": 3, 7: None}
+    with patch("loguru.logger.info") as mock_info:
+        sym_logger.log_event("event", data)
+        with patch("rabbitmirror.symbolic_logger.orjson", None):
+            sym_logger.log_event("event", data)
+    first, second = (c.args[0] for c in mock_info.call_args_list)
+    assert first == second == 'event: {"title":"Café 🐰","count":3,"7":null}'
+
+
+def test_log_event_stdlib_fallback_serializes_dates(sym_logger):
+    data = {
+        "at": datetime(2024, 1, 2, 3, 4, 5, 123456),
+        "day": date(2024, 1, 2),
+        "time": time(1, 2),
+    }
+    with patch("loguru.logger.info") as mock_info:
+        sym_logger.log_event("event", data)
+        with patch("rabbitmirror.symbolic_logger.orjson", None):
+            sym_logger.log_event("event", data)
+            with pytest.raises(TypeError):
+                sym_logger.log_event("event", {"bad": object()})
+    first, second = (c.args[0] for c in mock_info.call_args_list)
+    assert (
+        first
+        == second
+        == (
+            'event: {"at":"2024-01-02T03:04:05.123456","day":"2024-01-02",'
+            '"time":"01:02:00"}'
         )
+    )
@@ -4,9 +4,10 @@ Test cases for TrendAnalyzer class.
 
 from datetime import datetime
 
+import numpy as np
 import pytest
 
-from rabbitmirror.trend_analyzer import TrendAnalyzer, TrendMetric
+from rabbitmirror.trend_analyzer import TrendAnalyzer, TrendMetric, _period_keys
 
 # from datetime import timedelta
 # from unittest.mock import patch
@@ -15,13 +16,15 @@ from rabbitmirror.trend_analyzer import TrendAnalyzer, TrendMetric
 # from rabbitmirror.trend_analyzer import SignificantChange
 
 
+@pytest.fixture(scope="class")
+def analyzer():
+    """Default (daily) analyzer shared by the tests in a class."""
+    return TrendAnalyzer()
+
+
 class TestTrendAnalyzer:
     """Test cases for TrendAnalyzer."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.analyzer = TrendAnalyzer()
-
     def test_initialization_default(self):
         """Test TrendAnalyzer initialization with default parameters."""
         analyzer = TrendAnalyzer()
@@ -40,9 +43,9 @@ class TestTrendAnalyzer:
         with pytest.raises(ValueError, match="Period type must be one of"):
             TrendAnalyzer(period_type="invalid")
 
-    def test_analyze_trends_empty_data(self):
+    def test_analyze_trends_empty_data(self, analyzer):
         """Test trend analysis with empty data."""
-        result = self.analyzer.analyze_trends([])
+        result = analyzer.analyze_trends([])
 
         assert result["period_type"] == "daily"
         assert result["timeframes"] == []
@@ -52,7 +55,7 @@ class TestTrendAnalyzer:
         assert result["date_range"]["start"] is None
         assert result["date_range"]["end"] is None
 
-    def test_analyze_trends_basic_data(self):
+    def test_analyze_trends_basic_data(self, analyzer):
         """Test trend analysis with basic sample data."""
         entries = [
             {
@@ -75,7 +78,7 @@ class TestTrendAnalyzer:
             },
         ]
 
-        result = self.analyzer.analyze_trends(entries)
+        result = analyzer.analyze_trends(entries)
 
         assert result["period_type"] == "daily"
         assert len(result["timeframes"]) == 2  # 2 days
@@ -107,7 +110,29 @@ class TestTrendAnalyzer:
         key = analyzer._get_period_key(timestamp)
         assert key == "2024-01"
 
-    def test_calculate_period_metrics(self):
+    @pytest.mark.parametrize("period_type", ["daily", "weekly", "monthly"])
+    def test_vectorized_period_keys_match_scalar_keys(self, period_type):
+        """Test bulk period keys agree with the per-timestamp key."""
+        analyzer = TrendAnalyzer(period_type=period_type)
+        days = np.arange(np.datetime64("1999-12-01"), np.datetime64("2025-02-01"))
+
+        expected = [analyzer._get_period_key(day) for day in days.astype(object)]
+        assert analyzer._get_period_keys(days) == expected
+
+    def test_period_keys_are_cached_by_content(self):
+        """Test repeated key generation for the same days reuses the cache."""
+        _period_keys.cache_clear()
+        days = np.arange(np.datetime64("2024-01-01"), np.datetime64("2024-03-01"))
+
+        first = TrendAnalyzer(period_type="weekly")._get_period_keys(days)
+        second = TrendAnalyzer(period_type="weekly")._get_period_keys(days.copy())
+        TrendAnalyzer(period_type="monthly")._get_period_keys(days)
+
+        assert first == second
+        info = _period_keys.cache_info()
+        assert (info.hits, info.misses) == (1, 2)
+
+    def test_calculate_period_metrics(self, analyzer):
         """Test period metrics calculation."""
         time_periods = {
             "2024-01-01": [
@@ -117,7 +142,7 @@ class TestTrendAnalyzer:
             "2024-01-02": [{"duration": 1200, "channel": "A", "category": "tech"}],
         }
 
-        metrics = self.analyzer._calculate_period_metrics(time_periods)
+        metrics = analyzer._calculate_period_metrics(time_periods)
 
         assert metrics["video_count"] == [2, 1]
         assert metrics["total_duration"] == [1500, 1200]
@@ -125,7 +150,7 @@ class TestTrendAnalyzer:
         assert metrics["unique_channels"] == [2, 1]
         assert metrics["categories_diversity"] == [2, 1]
 
-    def test_count_sessions_single_session(self):
+    def test_count_sessions_single_session(self, analyzer):
         """Test session counting with single session."""
         entries = [
             {"timestamp": "2024-01-01T10:00:00"},
@@ -133,10 +158,10 @@ class TestTrendAnalyzer:
             {"timestamp": "2024-01-01T10:10:00"},
         ]
 
-        sessions = self.analyzer._count_sessions(entries, gap_threshold=30)
+        sessions = analyzer._count_sessions(entries, gap_threshold=30)
         assert sessions == 1
 
-    def test_count_sessions_multiple_sessions(self):
+    def test_count_sessions_multiple_sessions(self, analyzer):
         """Test session counting with multiple sessions."""
         entries = [
             {"timestamp": "2024-01-01T10:00:00"},
@@ -144,27 +169,41 @@ class TestTrendAnalyzer:
             {"timestamp": "2024-01-01T12:00:00"},  # 2 hour gap > 30 min threshold
         ]
 
-        sessions = self.analyzer._count_sessions(entries, gap_threshold=30)
+        sessions = analyzer._count_sessions(entries, gap_threshold=30)
         assert sessions == 2
 
-    def test_count_sessions_empty_entries(self):
+    def test_count_sessions_unsorted_and_offset_timestamps(self, analyzer):
+        """Test session counting sorts entries and handles UTC offsets."""
+        unsorted = [
+            {"timestamp": "2024-01-01T12:00:00"},
+            {"timestamp": "2024-01-01T10:00:00"},
+            {"timestamp": "2024-01-01T10:30:00"},
+            {"timestamp": "2024-01-01T10:05:00"},
+        ]
+        offsets = [{"timestamp": e["timestamp"] + "+00:00"} for e in unsorted]
+
+        assert analyzer._count_sessions(unsorted, gap_threshold=30) == 2
+        assert analyzer._count_sessions(unsorted, gap_threshold=20) == 3
+        assert analyzer._count_sessions(offsets, gap_threshold=20) == 3
+
+    def test_count_sessions_empty_entries(self, analyzer):
         """Test session counting with empty entries."""
-        sessions = self.analyzer._count_sessions([])
+        sessions = analyzer._count_sessions([])
         assert sessions == 0
 
-    def test_analyze_metric_trend_single_value(self):
+    def test_analyze_metric_trend_single_value(self, analyzer):
         """Test metric trend analysis with single value."""
         values = [10]
         timeframes = ["2024-01-01"]
 
-        trend = self.analyzer._analyze_metric_trend("test_metric", values, timeframes)
+        trend = analyzer._analyze_metric_trend("test_metric", values, timeframes)
 
         assert trend.name == "test_metric"
         assert trend.values == values
         assert trend.trend_direction == "stable"
         assert trend.trend_strength == 0.0
 
-    def test_analyze_metric_trend_increasing(self):
+    def test_analyze_metric_trend_increasing(self, analyzer):
         """Test metric trend analysis with increasing trend."""
         values = [10, 20, 30, 40, 50]
         timeframes = [
@@ -175,12 +214,12 @@ class TestTrendAnalyzer:
             "2024-01-05",
         ]
 
-        trend = self.analyzer._analyze_metric_trend("test_metric", values, timeframes)
+        trend = analyzer._analyze_metric_trend("test_metric", values, timeframes)
 
         assert trend.trend_direction == "increasing"
         assert trend.trend_strength > 0.8  # Strong correlation
 
-    def test_analyze_metric_trend_decreasing(self):
+    def test_analyze_metric_trend_decreasing(self, analyzer):
         """Test metric trend analysis with decreasing trend."""
         values = [50, 40, 30, 20, 10]
         timeframes = [
@@ -191,12 +230,12 @@ class TestTrendAnalyzer:
             "2024-01-05",
         ]
 
-        trend = self.analyzer._analyze_metric_trend("test_metric", values, timeframes)
+        trend = analyzer._analyze_metric_trend("test_metric", values, timeframes)
 
         assert trend.trend_direction == "decreasing"
         assert trend.trend_strength > 0.8  # Strong correlation
 
-    def test_analyze_metric_trend_stable(self):
+    def test_analyze_metric_trend_stable(self, analyzer):
         """Test metric trend analysis with stable trend."""
         values = [20, 20, 20, 20, 20]  # Completely stable values
         timeframes = [
@@ -207,11 +246,47 @@ class TestTrendAnalyzer:
             "2024-01-05",
         ]
 
-        trend = self.analyzer._analyze_metric_trend("test_metric", values, timeframes)
+        trend = analyzer._analyze_metric_trend("test_metric", values, timeframes)
 
         assert trend.trend_direction == "stable"
 
-    def test_detect_significant_changes(self):
+    def test_analyze_metric_trend_matches_regression(self, analyzer):
+        """Test closed-form trend statistics against numpy's regression."""
+        values = [3.0, 7.5, 4.0, 9.0, 8.5, 12.0]
+        x = np.arange(len(values))
+
+        trend = analyzer._analyze_metric_trend("test_metric", values, [])
+
+        slope, _ = np.polyfit(x, values, 1)
+        correlation = np.corrcoef(x, values)[0, 1]
+        assert trend.trend_direction == ("increasing" if slope > 0 else "decreasing")
+        assert trend.trend_strength == pytest.approx(abs(correlation))
+        assert trend.statistical_significance == pytest.approx(
+            min(1.0, abs(correlation) * len(values) / 10)
+        )
+
+    def test_analyze_metric_trends_batches_match_single_metrics(self, analyzer):
+        """Test batched trend analysis matches analyzing each metric alone."""
+        metric_values = {
+            "video_count": [10, 20, 30, 40],
+            "total_duration": [400.0, 300.0, 350.0, 100.0],
+            "unique_channels": [3, 3, 3, 3],
+            "avg_engagement": [0.2, 0.9],
+            "session_count": [4],
+        }
+        timeframes = ["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04"]
+
+        trends = analyzer._analyze_metric_trends(metric_values, timeframes)
+
+        assert list(trends) == list(metric_values)
+        for name, values in metric_values.items():
+            single = analyzer._analyze_metric_trend(name, values, timeframes)
+            assert trends[name] == single
+        assert trends["video_count"].trend_direction == "increasing"
+        assert trends["unique_channels"].trend_strength == 0.0
+        assert trends["session_count"].trend_direction == "stable"
+
+    def test_detect_significant_changes(self, analyzer):
         """Test significant change detection."""
         trend_metric = TrendMetric(
             name="test_metric",
@@ -222,13 +297,33 @@ class TestTrendAnalyzer:
             statistical_significance=0.9,
         )
 
-        changes = self.analyzer._detect_significant_changes(trend_metric)
+        changes = analyzer._detect_significant_changes(trend_metric)
 
         assert len(changes) == 1
         assert changes[0].metric == "test_metric"
         assert changes[0].change_percentage == 100.0
 
-    def test_detect_significant_changes_no_changes(self):
+    def test_detect_significant_changes_skips_zero_baselines(self, analyzer):
+        """Test changes from zero are skipped and later changes keep their order."""
+        trend_metric = TrendMetric(
+            name="test_metric",
+            values=[0, 10, 4, 0, 5],
+            timeframes=["a", "b", "c", "d", "e"],
+            trend_direction="stable",
+            trend_strength=0.1,
+            statistical_significance=0.1,
+        )
+
+        changes = analyzer._detect_significant_changes(trend_metric)
+
+        assert [(c.timeframe, c.from_value, c.to_value) for c in changes] == [
+            ("c", 10, 4),
+            ("d", 4, 0),
+        ]
+        assert [c.change_percentage for c in changes] == [-60.0, -100.0]
+        assert changes[0].description == "Significant decrease of 60.0%"
+
+    def test_detect_significant_changes_no_changes(self, analyzer):
         """Test significant change detection with no significant changes."""
         trend_metric = TrendMetric(
             name="test_metric",
@@ -239,11 +334,11 @@ class TestTrendAnalyzer:
             statistical_significance=0.1,
         )
 
-        changes = self.analyzer._detect_significant_changes(trend_metric)
+        changes = analyzer._detect_significant_changes(trend_metric)
 
         assert len(changes) == 0
 
-    def test_generate_summary(self):
+    def test_generate_summary(self, analyzer):
         """Test summary generation."""
         trends = {
             "metric1": TrendMetric(
@@ -258,7 +353,7 @@ class TestTrendAnalyzer:
         }
         changes = []
 
-        summary = self.analyzer._generate_summary(trends, changes)
+        summary = analyzer._generate_summary(trends, changes)
 
         assert summary["total_metrics_analyzed"] == 3
         assert summary["significant_changes_detected"] == 0
@@ -267,7 +362,7 @@ class TestTrendAnalyzer:
         assert "metric3" in summary["stable_metrics"]
         assert len(summary["strongest_trends"]) == 3
 
-    def test_get_date_range(self):
+    def test_get_date_range(self, analyzer):
         """Test date range calculation."""
         entries = [
             {"timestamp": "2024-01-01T10:00:00"},
@@ -275,14 +370,27 @@ class TestTrendAnalyzer:
             {"timestamp": "2024-01-03T12:00:00"},
         ]
 
-        date_range = self.analyzer._get_date_range(entries)
+        date_range = analyzer._get_date_range(entries)
 
         assert date_range["start"] == "2024-01-01T10:00:00"
         assert date_range["end"] == "2024-01-05T15:00:00"
 
-    def test_get_date_range_empty(self):
+    def test_get_date_range_normalizes_to_isoformat(self, analyzer):
+        """Test date range bounds are returned in canonical ISO format."""
+        entries = [
+            {"timestamp": "2024-01-03 12:00"},
+            {"timestamp": "2024-01-01T10:00:00.000000"},
+            {"timestamp": "2024-01-05"},
+        ]
+
+        assert analyzer._get_date_range(entries) == {
+            "start": "2024-01-01T10:00:00",
+            "end": "2024-01-05T00:00:00",
+        }
+
+    def test_get_date_range_empty(self, analyzer):
         """Test date range calculation with empty entries."""
-        date_range = self.analyzer._get_date_range([])
+        date_range = analyzer._get_date_range([])
 
         assert date_range["start"] is None
         assert date_range["end"] is None
@@ -299,7 +407,7 @@ class TestTrendAnalyzer:
         max_normalized = max(trend.values)
         assert max_normalized == 1.0
 
-    def test_group_by_time_period(self):
+    def test_group_by_time_period(self, analyzer):
         """Test grouping entries by time period."""
         entries = [
             {"timestamp": "2024-01-01T10:00:00", "title": "Video 1"},
@@ -307,7 +415,7 @@ class TestTrendAnalyzer:
             {"timestamp": "2024-01-02T10:00:00", "title": "Video 3"},
         ]
 
-        periods = self.analyzer._group_by_time_period(entries)
+        periods = analyzer._group_by_time_period(entries)
 
         assert len(periods) == 2
         assert "2024-01-01" in periods
@@ -315,6 +423,23 @@ class TestTrendAnalyzer:
         assert len(periods["2024-01-01"]) == 2
         assert len(periods["2024-01-02"]) == 1
 
+    def test_group_by_time_period_keeps_local_dates_with_offsets(self, analyzer):
+        """Test offset timestamps group by their own wall-clock date."""
+        entries = [
+            {"timestamp": "2024-01-01T23:30:00-08:00", "title": "Video 1"},
+            {"timestamp": "2024-01-02 00:15:00", "title": "Video 2"},
+            {"timestamp": "2024-01-01T08:00:00", "title": "Video 3"},
+        ]
+
+        periods = analyzer._group_by_time_period(entries)
+
+        assert list(periods) == ["2024-01-01", "2024-01-02"]
+        assert [e["title"] for e in periods["2024-01-01"]] == ["Video 1", "Video 3"]
+        weekly = TrendAnalyzer(period_type="weekly")._group_by_time_period(entries)
+        assert list(weekly) == [
+            TrendAnalyzer(period_type="weekly")._get_period_key(datetime(2024, 1, 1))
+        ]
+
     def test_weekly_period_analysis(self):
         """Test trend analysis with weekly periods."""
         analyzer = TrendAnalyzer(period_type="weekly")
@@ -341,14 +466,14 @@ class TestTrendAnalyzer:
         assert result["period_type"] == "monthly"
         assert len(result["timeframes"]) == 2
 
-    def test_specific_metrics_analysis(self):
+    def test_specific_metrics_analysis(self, analyzer):
         """Test trend analysis with specific metrics only."""
         entries = [
             {"timestamp": "2024-01-01T10:00:00", "title": "Video 1", "duration": 600},
             {"timestamp": "2024-01-02T10:00:00", "title": "Video 2", "duration": 900},
         ]
 
-        result = self.analyzer.analyze_trends(
+        result = analyzer.analyze_trends(
             entries, metrics=["video_count", "total_duration"]
         )
 
@@ -356,20 +481,20 @@ class TestTrendAnalyzer:
         assert "total_duration" in result["metrics"]
         assert "avg_duration" not in result["metrics"]  # Not requested
 
-    def test_engagement_metrics_calculation(self):
+    def test_engagement_metrics_calculation(self, analyzer):
         """Test calculation of engagement metrics when available."""
         time_periods = {
             "2024-01-01": [{"engagement_score": 0.8}, {"engagement_score": 0.9}]
         }
 
-        metrics = self.analyzer._calculate_period_metrics(time_periods)
+        metrics = analyzer._calculate_period_metrics(time_periods)
 
         assert "avg_engagement" in metrics
         assert (
             abs(metrics["avg_engagement"][0] - 0.85) < 0.001
         )  # Use approximate equality for floating point
 
-    def test_viewing_velocity_calculation(self):
+    def test_viewing_velocity_calculation(self, analyzer):
         """Test viewing velocity calculation."""
         time_periods = {
             "2024-01-01": [
@@ -378,15 +503,15 @@ class TestTrendAnalyzer:
             ]
         }
 
-        metrics = self.analyzer._calculate_period_metrics(time_periods)
+        metrics = analyzer._calculate_period_metrics(time_periods)
 
         # 2 videos in 1.5 hours = 1.33 videos per hour
         assert abs(metrics["viewing_velocity"][0] - 1.333) < 0.01
 
-    def test_viewing_velocity_zero_duration(self):
+    def test_viewing_velocity_zero_duration(self, analyzer):
         """Test viewing velocity calculation with zero total duration."""
         time_periods = {"2024-01-01": [{"duration": 0}, {"duration": 0}]}
 
-        metrics = self.analyzer._calculate_period_metrics(time_periods)
+        metrics = analyzer._calculate_period_metrics(time_periods)
 
         assert metrics["viewing_velocity"][0] == 0